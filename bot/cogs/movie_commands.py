@@ -125,7 +125,8 @@ class MovieCommands(commands.Cog):
         """Request a movie or TV show by title"""
         await interaction.response.defer(ephemeral=True)
 
-        # Check if user is authorized (if whitelist is configured)
+        # Check if user is authorized (if whitelist is configured). The whitelist is a handful
+        # of IDs, so scanning the live list is as fast as a set and never goes stale
         authorized_users = self.bot.settings.discord.authorized_users
         if authorized_users:
             if interaction.user.id not in authorized_users:
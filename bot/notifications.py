@@ -1,13 +1,16 @@
 """Notification system for tracking and notifying users about completed requests"""
 
 import asyncio
-import json
+import functools
 import logging
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import discord
+import orjson
 from discord.ext import tasks
 
 from bot.overseerr import MediaStatus
@@ -17,27 +20,75 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-
+# Compact the notifications journal once it holds this many times more entries than there are
+# pending requests (and at least JOURNAL_COMPACT_MIN_ENTRIES entries)
+JOURNAL_COMPACT_RATIO = 4
+JOURNAL_COMPACT_MIN_ENTRIES = 32
+
+# Most Overseerr lookups in flight at once during an availability check
+MAX_CONCURRENT_LOOKUPS = 5
+
+# Bound once for the identity checks in the availability loop; MediaStatus members are singletons
+AVAILABLE = MediaStatus.AVAILABLE
+
+# Pending requests are keyed by (user_id, tmdb_id, is_4k)
+RequestKey = Tuple[int, int, bool]
+
+
+def _parse_key(raw: Union[str, List[Any]]) -> RequestKey:
+    """Read a journal key: ``[user_id, tmdb_id, is_4k]``, or the older ``"user:tmdb[_4k]"``"""
+    if isinstance(raw, str):
+        user_id, _, tmdb_id = raw.partition(":")
+        is_4k = tmdb_id.endswith("_4k")
+        return int(user_id), int(tmdb_id.removesuffix("_4k")), is_4k
+    user_id, tmdb_id, is_4k = raw
+    return user_id, tmdb_id, is_4k
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_elapsed(total_minutes: int) -> str:
+    """Format an elapsed time given in whole minutes; cached since check cycles repeat values"""
+    days = total_minutes // 1440
+    hours = (total_minutes % 1440) // 60
+    minutes = total_minutes % 60
+
+    if days > 0:
+        if days == 1:
+            return f"{days} day, {hours} hours"
+        return f"{days} days, {hours} hours"
+    elif hours > 0:
+        if hours == 1:
+            return f"{hours} hour, {minutes} minutes"
+        return f"{hours} hours, {minutes} minutes"
+    else:
+        if minutes == 1:
+            return f"{minutes} minute"
+        return f"{minutes} minutes"
+
+
+@dataclass(slots=True)
 class PendingRequest:
     """Represents a pending media request"""
 
-    def __init__(
-        self,
-        user_id: int,
-        username: str,
-        tmdb_id: int,
-        title: str,
-        timestamp: str,
-        is_4k: bool = False,
-        last_status: int = MediaStatus.UNKNOWN,
-    ) -> None:
-        self.user_id = user_id
-        self.username = username
-        self.tmdb_id = tmdb_id
-        self.title = title
-        self.timestamp = timestamp
-        self.is_4k = is_4k
-        self.last_status = MediaStatus(last_status) if isinstance(last_status, int) else last_status
+    user_id: int
+    username: str
+    tmdb_id: int
+    title: str
+    timestamp: int  # Unix time in seconds
+    is_4k: bool = False
+    last_status: MediaStatus = MediaStatus.UNKNOWN
+
+    def __post_init__(self) -> None:
+        """Accept a raw status code and ISO-format timestamps from older notification files"""
+        if isinstance(self.timestamp, str):
+            self.timestamp = int(datetime.fromisoformat(self.timestamp).timestamp())
+        if isinstance(self.last_status, int):
+            self.last_status = MediaStatus(self.last_status)
+
+    @property
+    def key(self) -> RequestKey:
+        """Key identifying this request in NotificationManager.pending_requests"""
+        return (self.user_id, self.tmdb_id, self.is_4k)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -64,26 +115,7 @@ class PendingRequest:
 
     def get_elapsed_time(self) -> str:
         """Calculate elapsed time since request"""
-        request_time = datetime.fromisoformat(self.timestamp)
-        now = datetime.now()
-        elapsed = now - request_time
-
-        days = elapsed.days
-        hours = elapsed.seconds // 3600
-        minutes = (elapsed.seconds % 3600) // 60
-
-        if days > 0:
-            if days == 1:
-                return f"{days} day, {hours} hours"
-            return f"{days} days, {hours} hours"
-        elif hours > 0:
-            if hours == 1:
-                return f"{hours} hour, {minutes} minutes"
-            return f"{hours} hours, {minutes} minutes"
-        else:
-            if minutes == 1:
-                return f"{minutes} minute"
-            return f"{minutes} minutes"
+        return _format_elapsed(max(int(time.time()) - self.timestamp, 0) // 60)
 
 
 class NotificationManager:
@@ -94,7 +126,9 @@ class NotificationManager:
     ) -> None:
         self.bot = bot
         self.notifications_file = Path(notifications_file)
-        self.pending_requests: Dict[str, PendingRequest] = {}
+        self.pending_requests: Dict[RequestKey, PendingRequest] = {}
+        self._journal_entries = 0
+        self._needs_rewrite = False
         self.load_notifications()
 
         # Configure check interval from settings
@@ -103,30 +137,120 @@ class NotificationManager:
         logger.info(f"Notification check interval set to {check_interval} minute(s)")
 
     def load_notifications(self) -> None:
-        """Load pending notifications from file"""
-        if self.notifications_file.exists():
+        """Load pending notifications from file
+
+        The file is a journal with one JSON entry per line: ``{"op": "add", "k": key, "v": {...}}``
+        or ``{"op": "remove", "k": key}``, where key is ``[user_id, tmdb_id, is_4k]``, replayed in
+        order. A single JSON object mapping keys to requests (the pre-journal format) is also
+        accepted and rewritten as a journal on the next save.
+        """
+        self.pending_requests = {}
+        self._journal_entries = 0
+        self._needs_rewrite = False
+        if not self.notifications_file.exists():
+            return
+
+        try:
+            raw = self.notifications_file.read_bytes()
             try:
-                with open(self.notifications_file, "r") as f:
-                    data = json.load(f)
-                    self.pending_requests = {
-                        key: PendingRequest.from_dict(req) for key, req in data.items()
-                    }
-                logger.info(f"Loaded {len(self.pending_requests)} pending notification(s)")
-            except Exception as e:
-                logger.error(f"Error loading notifications: {e}")
-                self.pending_requests = {}
-        else:
+                snapshot = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                snapshot = None
+
+            if isinstance(snapshot, dict) and "op" not in snapshot:
+                requests = (PendingRequest.from_dict(req) for req in snapshot.values())
+                self.pending_requests = {request.key: request for request in requests}
+                self._needs_rewrite = True
+            else:
+                self._replay_journal(raw.splitlines())
+                # A torn last line has no newline, so a blind append would be glued onto it
+                # and lost with it on the next replay; rewrite the journal before appending
+                if raw and not raw.endswith(b"\n"):
+                    self._needs_rewrite = True
+            logger.info(f"Loaded {len(self.pending_requests)} pending notification(s)")
+        except Exception as e:
+            logger.error(f"Error loading notifications: {e}")
             self.pending_requests = {}
 
+    def _replay_journal(self, lines: List[bytes]) -> None:
+        """Apply journal entries to pending_requests in order"""
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                # Most likely a write torn by a crash; the other entries are still good
+                logger.warning(f"Skipping unreadable notifications entry on line {line_number}")
+                self._needs_rewrite = True
+                continue
+
+            try:
+                op = entry["op"]
+                key = _parse_key(entry["k"])
+                if op == "add":
+                    request = PendingRequest.from_dict(entry["v"])
+                elif op != "remove":
+                    raise ValueError(f"unknown op {op!r}")
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                # Valid JSON but not an entry we wrote; skip it like a torn line
+                logger.warning(f"Skipping malformed notifications entry on line {line_number}: {e}")
+                self._needs_rewrite = True
+                continue
+
+            self._journal_entries += 1
+            if op == "add":
+                self.pending_requests[key] = request
+            else:
+                self.pending_requests.pop(key, None)
+
+    def _should_compact(self) -> bool:
+        """Whether the journal has grown well past the number of live requests"""
+        return (
+            self._journal_entries >= JOURNAL_COMPACT_MIN_ENTRIES
+            and self._journal_entries > JOURNAL_COMPACT_RATIO * len(self.pending_requests)
+        )
+
+    def _append(self, op: str, key: RequestKey, request: Optional[PendingRequest] = None) -> None:
+        """Append one add/remove entry to the journal, compacting it once it grows too long"""
+        if self._needs_rewrite:
+            # Appending to a pre-journal or torn file would corrupt it; pending_requests
+            # already has this change, so a full rewrite records it
+            self.save_notifications()
+            return
+
+        entry: Dict[str, Any] = {"op": op, "k": key}
+        if request is not None:
+            entry["v"] = request.to_dict()
+
+        try:
+            self.notifications_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.notifications_file, "ab") as f:
+                f.write(orjson.dumps(entry) + b"\n")
+            self._journal_entries += 1
+        except Exception as e:
+            logger.error(f"Error saving notifications: {e}")
+            return
+
+        if self._should_compact():
+            self.save_notifications()
+
     def save_notifications(self) -> None:
-        """Save pending notifications to file"""
+        """Rewrite the journal as a single add entry per pending request"""
         try:
             # Ensure directory exists
             self.notifications_file.parent.mkdir(parents=True, exist_ok=True)
 
-            data = {key: req.to_dict() for key, req in self.pending_requests.items()}
-            with open(self.notifications_file, "w") as f:
-                json.dump(data, f, indent=2)
+            journal = b"".join(
+                orjson.dumps({"op": "add", "k": key, "v": req.to_dict()}) + b"\n"
+                for key, req in self.pending_requests.items()
+            )
+            # Write aside and rename so a crash mid-write never truncates the journal
+            tmp_file = self.notifications_file.with_name(self.notifications_file.name + ".tmp")
+            tmp_file.write_bytes(journal)
+            tmp_file.replace(self.notifications_file)
+            self._journal_entries = len(self.pending_requests)
+            self._needs_rewrite = False
         except Exception as e:
             logger.error(f"Error saving notifications: {e}")
 
@@ -134,7 +258,7 @@ class NotificationManager:
         self, user_id: int, username: str, tmdb_id: int, title: str, is_4k: bool = False
     ) -> None:
         """Add a request to be tracked for notifications"""
-        key = f"{user_id}:{tmdb_id}{'_4k' if is_4k else ''}"
+        key = (user_id, tmdb_id, is_4k)
 
         # Don't add if already tracking
         if key in self.pending_requests:
@@ -146,12 +270,12 @@ class NotificationManager:
             username=username,
             tmdb_id=tmdb_id,
             title=title,
-            timestamp=datetime.now().isoformat(),
+            timestamp=int(time.time()),
             is_4k=is_4k,
         )
 
         self.pending_requests[key] = request
-        self.save_notifications()
+        self._append("add", key, request)
         logger.info(f"✅ Added notification tracking for {username}: {title}")
 
     async def check_pending_on_startup(self) -> None:
@@ -179,16 +303,33 @@ class NotificationManager:
 
     async def _check_and_notify(self) -> int:
         """Core logic to check availability and notify users"""
-        completed_keys: List[str] = []
+        completed_keys: List[RequestKey] = []
 
         logger.info(
             f"━━━━━━━━━━ Checking {len(self.pending_requests)} Pending Request(s) ━━━━━━━━━━"
         )
 
-        for key, request in list(self.pending_requests.items()):
+        pending = list(self.pending_requests.items())
+
+        # Look up each distinct (movie, 4K) pair once, a few at a time so a large backlog
+        # doesn't hit Overseerr with a burst of requests
+        lookups = list(dict.fromkeys((request.tmdb_id, request.is_4k) for _, request in pending))
+        limit = asyncio.Semaphore(MAX_CONCURRENT_LOOKUPS)
+
+        async def lookup(tmdb_id: int, is_4k: bool) -> Any:
+            async with limit:
+                return await self.bot.overseerr.get_movie_by_id(tmdb_id, is_4k=is_4k)
+
+        results = await asyncio.gather(
+            *(lookup(tmdb_id, is_4k) for tmdb_id, is_4k in lookups),
+            return_exceptions=True,
+        )
+        movies = dict(zip(lookups, results))
+
+        for key, request in pending:
             try:
                 # Log request details
-                request_time = datetime.fromisoformat(request.timestamp)
+                request_time = datetime.fromtimestamp(request.timestamp)
                 time_ago = request.get_elapsed_time()
                 human_time = request_time.strftime("%Y-%m-%d %H:%M:%S")
 
@@ -196,10 +337,9 @@ class NotificationManager:
                 logger.info(f"     Requested by: {request.username} (UID {request.user_id})")
                 logger.info(f"     Requested at: {human_time} ({time_ago} ago)")
 
-                # Check movie status in Overseerr
-                movie = await self.bot.overseerr.get_movie_by_id(
-                    request.tmdb_id, is_4k=request.is_4k
-                )
+                movie = movies[(request.tmdb_id, request.is_4k)]
+                if isinstance(movie, BaseException):
+                    raise movie
 
                 logger.info(
                     f"     Current status: {movie.status.name} "
@@ -207,13 +347,13 @@ class NotificationManager:
                 )
 
                 # Check if status changed
-                if movie.status != request.last_status:
+                if movie.status is not request.last_status:
                     logger.info(
                         f"     🔄 Status changed: {request.last_status.name} → {movie.status.name}"
                     )
                     await self.notify_status_change(request, request.last_status, movie.status)
                     request.last_status = movie.status
-                    self.save_notifications()
+                    self._append("add", key, request)
 
                 if movie.available:
                     logger.info(f"     ✅ AVAILABLE - Removing from tracking")
@@ -230,9 +370,9 @@ class NotificationManager:
         # Remove completed requests
         for key in completed_keys:
             del self.pending_requests[key]
+            self._append("remove", key)
 
         if completed_keys:
-            self.save_notifications()
             logger.info(f"✅ {len(completed_keys)} request(s) completed and removed from tracking")
         else:
             logger.info(f"No requests completed in this check")
@@ -305,7 +445,7 @@ class NotificationManager:
 
             embed.add_field(name="Time Elapsed", value=elapsed_time, inline=True)
 
-            if new_status == MediaStatus.AVAILABLE:
+            if new_status is AVAILABLE:
                 embed.set_footer(text="Enjoy your movie! 🍿")
             else:
                 embed.set_footer(text="You'll be notified when the status changes.")
@@ -119,6 +119,26 @@ class TVShow:
 MediaItem = Movie | TVShow
 
 
+class OverseerrError(Exception):
+    """Base class for errors raised by OverseerrClient"""
+
+
+class OverseerrAuthError(OverseerrError):
+    """Overseerr rejected the API key"""
+
+
+class OverseerrNotFoundError(OverseerrError):
+    """The requested endpoint or media item does not exist"""
+
+
+class OverseerrConnectionError(OverseerrError):
+    """Overseerr could not be reached"""
+
+
+class OverseerrResponseError(OverseerrError):
+    """Overseerr returned an error status or an unexpected payload"""
+
+
 class MovieRequestResult:
     """Result of a movie request operation"""
 
@@ -175,19 +195,19 @@ class OverseerrClient:
             session = await self._get_session()
             async with session.get(f"{self.base_url}settings/main") as resp:
                 if resp.status == 401:
-                    raise Exception("Invalid API key")
+                    raise OverseerrAuthError("Invalid API key")
                 elif resp.status == 404:
-                    raise Exception("Invalid hostname/port - API endpoint not found")
+                    raise OverseerrNotFoundError("Invalid hostname/port - API endpoint not found")
 
                 data = await resp.json()
 
                 # Verify we got valid data
                 if "apiKey" not in data:
-                    raise Exception("Unexpected response from Overseerr")
+                    raise OverseerrResponseError("Unexpected response from Overseerr")
 
                 return True
         except aiohttp.ClientError as e:
-            raise Exception(f"Connection failed: {e}")
+            raise OverseerrConnectionError(f"Connection failed: {e}") from e
 
     async def search_media(self, query: str, is_4k: bool = False) -> List[MediaItem]:
         """
@@ -223,7 +243,7 @@ class OverseerrClient:
                     except:
                         error_message = error_text
 
-                    raise Exception(f"Search failed: {error_message}")
+                    raise OverseerrResponseError(f"Search failed: {error_message}")
 
                 data = await resp.json()
                 results = data.get("results", [])
@@ -283,8 +303,12 @@ class OverseerrClient:
             url = f"{self.base_url}movie/{tmdb_id}"
 
             async with session.get(url) as resp:
+                if resp.status == 404:
+                    raise OverseerrNotFoundError(f"Movie not found: {tmdb_id}")
                 if resp.status != 200:
-                    raise Exception(f"Movie not found: {tmdb_id}")
+                    raise OverseerrResponseError(
+                        f"Failed to get movie {tmdb_id}: HTTP {resp.status}"
+                    )
 
                 data = await resp.json()
                 return self._convert_movie(data, is_4k)
@@ -308,8 +332,12 @@ class OverseerrClient:
             url = f"{self.base_url}tv/{tmdb_id}"
 
             async with session.get(url) as resp:
+                if resp.status == 404:
+                    raise OverseerrNotFoundError(f"TV show not found: {tmdb_id}")
                 if resp.status != 200:
-                    raise Exception(f"TV show not found: {tmdb_id}")
+                    raise OverseerrResponseError(
+                        f"Failed to get TV show {tmdb_id}: HTTP {resp.status}"
+                    )
 
                 data = await resp.json()
                 return self._convert_tv(data, is_4k)
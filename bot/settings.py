@@ -1,18 +1,106 @@
-"""Settings management with Pydantic"""
+"""Settings management with stdlib dataclasses"""
 
+import hashlib
 import json
 import logging
 import os
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, List, Optional
-
-from pydantic import BaseModel, Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+_TRUE_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "f", "no", "n", "off"})
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment value"""
+    lowered = value.strip().lower()
+    if lowered in _TRUE_VALUES:
+        return True
+    if lowered in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid boolean value: {value!r}")
+
+
+def _parse_nonzero_int(value: str) -> Optional[int]:
+    """Parse an integer environment value, treating 0 as unset"""
+    return int(value) or None
+
+
+def _parse_user_ids(value: str) -> List[int]:
+    """Parse a comma-separated list of Discord user IDs"""
+    try:
+        return [int(uid.strip()) for uid in value.split(",") if uid.strip()]
+    except ValueError as e:
+        logger.error(f"Invalid DISCORD_AUTHORIZED_USERS format: {e}")
+        logger.error(f"Expected comma-separated integers, got: {value}")
+        return []
+
+
+# Environment overrides as (variable, BotSettings section or None for top level, attribute, parser)
+_ENV_DISPATCH = (
+    ("LOG_LEVEL", None, "log_level", str),
+    ("DISCORD_BOT_TOKEN", "discord", "bot_token", str),
+    ("DISCORD_CLIENT_ID", "discord", "client_id", str),
+    ("DISCORD_AUTHORIZED_USERS", "discord", "authorized_users", _parse_user_ids),
+    ("NOTIFICATION_CHECK_INTERVAL", "discord", "notification_check_interval", _parse_nonzero_int),
+    ("OVERSEERR_HOSTNAME", "overseerr", "hostname", str),
+    ("OVERSEERR_PORT", "overseerr", "port", _parse_nonzero_int),
+    ("OVERSEERR_API_KEY", "overseerr", "api_key", str),
+    ("OVERSEERR_USE_SSL", "overseerr", "use_ssl", _parse_bool),
+)
+
+
+def load_env(env_file: str = ".env") -> Dict[str, str]:
+    """
+    Read environment variables, layering os.environ over an optional .env file
+
+    Keys are upper-cased so lookups are case-insensitive.
+
+    Args:
+        env_file: Path to a KEY=VALUE file (missing files are ignored)
+
+    Returns:
+        Mapping of upper-cased variable names to raw string values
+    """
+    env: Dict[str, str] = {}
+    try:
+        content = Path(env_file).read_text(encoding="utf-8")
+    except OSError:
+        content = ""
+
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        key, sep, value = line.removeprefix("export ").partition("=")
+        if not sep:
+            continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+            value = value[1:-1]
+        else:
+            value = value.split(" #", 1)[0].rstrip()
+        env[key.strip().upper()] = value
+
+    env.update((key.upper(), value) for key, value in os.environ.items())
+    return env
+
+
+class _SettingsModel:
+    """Shared helpers for settings dataclasses"""
+
+    __slots__ = ()
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Return the settings as a plain dict"""
+        return asdict(self)
 
-class OverseerrSettings(BaseModel):
+
+@dataclass(slots=True)
+class OverseerrSettings(_SettingsModel):
     """Overseerr connection settings"""
 
     hostname: str = "localhost"
@@ -21,13 +109,10 @@ class OverseerrSettings(BaseModel):
     use_ssl: bool = False
     default_user_id: Optional[str] = None
 
-    @field_validator("port")
-    @classmethod
-    def validate_port(cls, v: int) -> int:
+    def __post_init__(self) -> None:
         """Validate port is in valid range"""
-        if not 1 <= v <= 65535:
-            raise ValueError(f"Port must be between 1 and 65535, got {v}")
-        return v
+        if not 1 <= self.port <= 65535:
+            raise ValueError(f"Port must be between 1 and 65535, got {self.port}")
 
     @property
     def base_url(self) -> str:
@@ -36,7 +121,8 @@ class OverseerrSettings(BaseModel):
         return f"{protocol}://{self.hostname}:{self.port}/api/v1/"
 
 
-class MovieCategorySettings(BaseModel):
+@dataclass(slots=True)
+class MovieCategorySettings(_SettingsModel):
     """Movie category configuration (e.g., 1080p vs 4K)"""
 
     id: int
@@ -45,89 +131,54 @@ class MovieCategorySettings(BaseModel):
     service_id: int = -1  # Radarr service ID in Overseerr
     profile_id: int = -1
     root_folder: str = ""
-    tags: List[int] = Field(default_factory=list)
+    tags: List[int] = field(default_factory=list)
 
 
-class DiscordSettings(BaseModel):
+@dataclass(slots=True)
+class DiscordSettings(_SettingsModel):
     """Discord bot configuration"""
 
     bot_token: str = ""
     client_id: str = ""
-    monitored_channels: List[int] = Field(default_factory=list)
-    movie_roles: List[int] = Field(default_factory=list)
-    authorized_users: List[int] = Field(default_factory=list)  # Discord user IDs allowed to use bot
+    monitored_channels: List[int] = field(default_factory=list)
+    movie_roles: List[int] = field(default_factory=list)
+    authorized_users: List[int] = field(default_factory=list)  # Discord user IDs allowed to use bot
     enable_dm_requests: bool = False
     auto_notify_requesters: bool = True
     notification_mode: str = "PrivateMessages"  # or "Channels"
-    notification_channels: List[int] = Field(default_factory=list)
+    notification_channels: List[int] = field(default_factory=list)
     notification_check_interval: int = 5  # Minutes between availability checks
 
-    @field_validator("notification_check_interval")
-    @classmethod
-    def validate_check_interval(cls, v: int) -> int:
+    def __post_init__(self) -> None:
         """Validate notification check interval is reasonable"""
-        if v < 1:
-            raise ValueError(f"Notification check interval must be at least 1 minute, got {v}")
-        return v
+        if self.notification_check_interval < 1:
+            raise ValueError(
+                "Notification check interval must be at least 1 minute, "
+                f"got {self.notification_check_interval}"
+            )
 
 
-class BotSettings(BaseSettings):
+@dataclass(slots=True)
+class BotSettings(_SettingsModel):
     """Main bot settings with environment variable support"""
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        env_nested_delimiter="__",
-        case_sensitive=False,
-    )
-
-    discord: DiscordSettings = Field(default_factory=DiscordSettings)
-    overseerr: OverseerrSettings = Field(default_factory=OverseerrSettings)
-    movie_categories: List[MovieCategorySettings] = Field(default_factory=list)
+    discord: DiscordSettings = field(default_factory=DiscordSettings)
+    overseerr: OverseerrSettings = field(default_factory=OverseerrSettings)
+    movie_categories: List[MovieCategorySettings] = field(default_factory=list)
     version: str = "1.0.0"
     log_level: str = "INFO"
 
-    # Environment variable overrides
-    discord_bot_token: Optional[str] = Field(None, alias="DISCORD_BOT_TOKEN")
-    discord_client_id: Optional[str] = Field(None, alias="DISCORD_CLIENT_ID")
-    discord_authorized_users: Optional[str] = Field(None, alias="DISCORD_AUTHORIZED_USERS")
-    notification_check_interval: Optional[int] = Field(None, alias="NOTIFICATION_CHECK_INTERVAL")
-    overseerr_hostname: Optional[str] = Field(None, alias="OVERSEERR_HOSTNAME")
-    overseerr_port: Optional[int] = Field(None, alias="OVERSEERR_PORT")
-    overseerr_api_key: Optional[str] = Field(None, alias="OVERSEERR_API_KEY")
-    overseerr_use_ssl: Optional[bool] = Field(None, alias="OVERSEERR_USE_SSL")
-
-    def model_post_init(self, __context: Any) -> None:
+    def __post_init__(self) -> None:
         """Apply environment variable overrides after initialization"""
-        if self.discord_bot_token:
-            self.discord.bot_token = self.discord_bot_token
-        if self.discord_client_id:
-            self.discord.client_id = self.discord_client_id
-        if self.discord_authorized_users:
-            # Parse comma-separated list of user IDs with validation
-            try:
-                user_ids = [
-                    int(uid.strip())
-                    for uid in self.discord_authorized_users.split(",")
-                    if uid.strip()
-                ]
-                self.discord.authorized_users = user_ids
-            except ValueError as e:
-                logger.error(f"Invalid DISCORD_AUTHORIZED_USERS format: {e}")
-                logger.error(
-                    f"Expected comma-separated integers, got: {self.discord_authorized_users}"
-                )
-                self.discord.authorized_users = []
-        if self.notification_check_interval:
-            self.discord.notification_check_interval = self.notification_check_interval
-        if self.overseerr_hostname:
-            self.overseerr.hostname = self.overseerr_hostname
-        if self.overseerr_port:
-            self.overseerr.port = self.overseerr_port
-        if self.overseerr_api_key:
-            self.overseerr.api_key = self.overseerr_api_key
-        if self.overseerr_use_ssl is not None:
-            self.overseerr.use_ssl = self.overseerr_use_ssl
+        env = load_env()
+        for env_name, section, attr, parser in _ENV_DISPATCH:
+            raw = env.get(env_name)
+            if not raw:
+                continue
+            value = parser(raw)
+            if value is None:
+                continue
+            setattr(getattr(self, section) if section else self, attr, value)
 
 
 class SettingsManager:
@@ -135,8 +186,13 @@ class SettingsManager:
 
     def __init__(self, config_path: str = "./config/settings.json") -> None:
         self.config_path = Path(config_path)
-        self.config_path.parent.mkdir(parents=True, exist_ok=True)
         self.settings: Optional[BotSettings] = None
+        self._last_hash: Optional[bytes] = None  # Digest of the last content read or written
+
+    @staticmethod
+    def _hash(buf: bytes) -> bytes:
+        """Hash serialized settings to detect unchanged content"""
+        return hashlib.blake2b(buf, digest_size=16).digest()
 
     def load(self) -> BotSettings:
         """Load settings from file and environment variables"""
@@ -146,22 +202,23 @@ class SettingsManager:
         # Then merge with JSON file if it exists
         if self.config_path.exists():
             try:
-                with open(self.config_path, "r") as f:
-                    data = json.load(f)
-
-                    # Update settings from file (env vars take precedence)
-                    if not self.settings.discord.bot_token and "discord" in data:
-                        discord_data = data["discord"]
-                        if "bot_token" in discord_data:
-                            self.settings.discord.bot_token = discord_data["bot_token"]
-                        if "client_id" in discord_data:
-                            self.settings.discord.client_id = discord_data["client_id"]
-
-                    # Merge other settings
-                    if "movie_categories" in data:
-                        self.settings.movie_categories = [
-                            MovieCategorySettings(**cat) for cat in data["movie_categories"]
-                        ]
+                raw = self.config_path.read_bytes()
+                self._last_hash = self._hash(raw)
+                data = json.loads(raw)
+
+                # Update settings from file (env vars take precedence)
+                if not self.settings.discord.bot_token and "discord" in data:
+                    discord_data = data["discord"]
+                    if "bot_token" in discord_data:
+                        self.settings.discord.bot_token = discord_data["bot_token"]
+                    if "client_id" in discord_data:
+                        self.settings.discord.client_id = discord_data["client_id"]
+
+                # Merge other settings
+                if "movie_categories" in data:
+                    self.settings.movie_categories = [
+                        MovieCategorySettings(**cat) for cat in data["movie_categories"]
+                    ]
             except json.JSONDecodeError as e:
                 logger.error(f"❌ Failed to parse config file {self.config_path}: {e}")
                 logger.warning("⚠️  Falling back to environment variables and defaults")
@@ -198,8 +255,16 @@ class SettingsManager:
                 "movie_categories": [cat.model_dump() for cat in self.settings.movie_categories],
             }
 
-            with open(self.config_path, "w") as f:
-                json.dump(data, f, indent=2)
+            buf = json.dumps(data, indent=2).encode("utf-8")
+
+            # Skip the write entirely when the file already holds this content
+            digest = self._hash(buf)
+            if digest == self._last_hash and self.config_path.exists():
+                return
+
+            self.config_path.parent.mkdir(parents=True, exist_ok=True)
+            self.config_path.write_bytes(buf)
+            self._last_hash = digest
 
     def reload(self) -> BotSettings:
         """Reload settings from file"""
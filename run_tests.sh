@@ -50,7 +50,7 @@ case $TEST_TYPE in
     
     "fast")
         print_status "Running fast tests (no coverage)..."
-        pytest -v
+        pytest --no-cov -v "${@:2}"
         ;;
     
     "coverage")
@@ -110,7 +110,7 @@ case $TEST_TYPE in
         echo "  all          - Run all tests with coverage (default)"
         echo "  unit         - Run unit tests only"
         echo "  integration  - Run integration tests only"
-        echo "  fast         - Run tests without coverage (faster)"
+        echo "  fast         - Run tests without coverage (faster), optionally limited to a path"
         echo "  coverage     - Run tests and generate detailed coverage report"
         echo "  watch        - Run tests in watch mode (re-run on file changes)"
         echo "  debug        - Run tests in debug mode (with pdb)"
@@ -123,6 +123,7 @@ case $TEST_TYPE in
         echo "  $0                               # Run all tests"
         echo "  $0 unit                          # Run unit tests"
         echo "  $0 specific tests/test_overseerr.py"
+        echo "  $0 fast tests/test_main.py       # Inner loop on one file, no coverage"
         echo "  $0 coverage                      # Generate coverage report"
         exit 0
         ;;
@@ -1,15 +1,40 @@
 """Pytest configuration and shared fixtures for Discord Overseerr Bot tests"""
 
 import asyncio
+import contextlib
+import copy
+import dataclasses
 import json
-import tempfile
+import os
+import re
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, Generator
-from unittest.mock import AsyncMock, MagicMock, Mock
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Mapping,
+    Pattern,
+    Tuple,
+    Union,
+)
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+import pytest_asyncio
 from aioresponses import aioresponses
 
+# bot.main configures root logging (including a logs/bot.log file handler) at import time.
+# conftest is imported before any test module, so neutralising basicConfig here keeps the
+# whole test session from attaching that handler, whichever module imports bot.main first.
+with patch("logging.basicConfig"):
+    from bot.main import MovieBot
+
+from bot.cogs.movie_commands import MovieCommands
+from bot.notifications import NotificationManager, PendingRequest
 from bot.overseerr import MediaStatus, Movie, OverseerrClient, TVShow
 from bot.settings import (
     BotSettings,
@@ -19,73 +44,291 @@ from bot.settings import (
     SettingsManager,
 )
 
+# Per-test time budget for tests/test_main.py; overruns are reported, and fail the run
+# only with --main-budget, since wall-clock timings are too noisy to gate every run on
+_MAIN_TEST_BUDGET_SECONDS = 0.1
+_over_budget: List[Tuple[str, float]] = []
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the opt-in flag that turns test_main.py budget overruns into failures"""
+    parser.addoption(
+        "--main-budget",
+        action="store_true",
+        default=False,
+        help=f"fail the run if a tests/test_main.py test takes over {_MAIN_TEST_BUDGET_SECONDS}s",
+    )
+
+
+def pytest_runtest_logreport(report: pytest.TestReport) -> None:
+    """Record test_main.py tests whose call phase runs over budget"""
+    if (
+        report.when == "call"
+        and report.nodeid.startswith("tests/test_main.py")
+        and report.duration > _MAIN_TEST_BUDGET_SECONDS
+    ):
+        _over_budget.append((report.nodeid, report.duration))
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """With --main-budget, fail an otherwise green run when a test_main.py test blew its budget"""
+    if (
+        _over_budget
+        and session.config.getoption("--main-budget")
+        and not hasattr(session.config, "workerinput")
+        and exitstatus == 0
+    ):
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter: Any, exitstatus: int, config: pytest.Config) -> None:
+    """List test_main.py tests that exceeded the per-test budget"""
+    if not _over_budget:
+        return
+    terminalreporter.section("test_main.py time budget exceeded", red=True)
+    for nodeid, duration in _over_budget:
+        terminalreporter.write_line(
+            f"{duration:.3f}s > {_MAIN_TEST_BUDGET_SECONDS}s  {nodeid}", red=True
+        )
+
+
+_TEST_ENV_VARS: Dict[str, str] = {
+    "DISCORD_BOT_TOKEN": "test_bot_token_12345",
+    "DISCORD_CLIENT_ID": "123456789",
+    "OVERSEERR_HOSTNAME": "test.overseerr.local",
+    "OVERSEERR_PORT": "5055",
+    "OVERSEERR_API_KEY": "test_api_key_abcdef",
+    "OVERSEERR_USE_SSL": "false",
+    "DISCORD_AUTHORIZED_USERS": "111111111,222222222,333333333",
+    "LOG_LEVEL": "DEBUG",
+}
+
+
+@contextlib.contextmanager
+def _patched_env(**values: Any) -> Generator[None, None, None]:
+    """Set environment variables in one os.environ.update and restore them on exit"""
+    saved = {key: os.environ.get(key) for key in values}
+    os.environ.update({key: str(value) for key, value in values.items()})
+    try:
+        yield
+    finally:
+        for key, old in saved.items():
+            if old is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = old
+
+
+@pytest.fixture
+def env() -> Callable[..., contextlib.AbstractContextManager]:
+    """Context manager factory: ``with env(NAME="value"):`` scopes env vars to the block"""
+    return _patched_env
+
 
 @pytest.fixture
-def mock_env_vars(monkeypatch) -> Dict[str, str]:
+def mock_env_vars() -> Generator[Dict[str, str], None, None]:
     """Mock environment variables for testing"""
-    env_vars = {
-        "DISCORD_BOT_TOKEN": "test_bot_token_12345",
-        "DISCORD_CLIENT_ID": "123456789",
-        "OVERSEERR_HOSTNAME": "test.overseerr.local",
-        "OVERSEERR_PORT": "5055",
-        "OVERSEERR_API_KEY": "test_api_key_abcdef",
-        "OVERSEERR_USE_SSL": "false",
-        "DISCORD_AUTHORIZED_USERS": "111111111,222222222,333333333",
-        "LOG_LEVEL": "DEBUG",
-    }
+    with _patched_env(**_TEST_ENV_VARS):
+        yield dict(_TEST_ENV_VARS)
 
-    for key, value in env_vars.items():
-        monkeypatch.setenv(key, value)
 
-    return env_vars
+@pytest.fixture(autouse=True)
+def _noop_tree_sync(monkeypatch) -> AsyncMock:
+    """Replace CommandTree.sync for every test so no test ever syncs with Discord
+
+    The mock lives on the class, so ``bot.tree.sync`` on any bot resolves to it and
+    tests can set ``return_value``/``side_effect`` or assert calls on it directly.
+    """
+    sync = AsyncMock(return_value=[])
+    monkeypatch.setattr("discord.app_commands.CommandTree.sync", sync)
+    return sync
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _no_leaked_tasks() -> AsyncGenerator[None, None]:
+    """Cancel tasks a test leaves running (e.g. NotificationManager's tasks.loop)"""
+    tasks_before = asyncio.all_tasks()
+    yield
+    leaked = asyncio.all_tasks() - tasks_before - {asyncio.current_task()}
+    for task in leaked:
+        task.cancel()
+    await asyncio.gather(*leaked, return_exceptions=True)
+
+
+_MISSING = object()
 
 
 @pytest.fixture
-def temp_config_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for config files"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def patch_attrs() -> Generator[Callable[..., None], None, None]:
+    """Set attributes directly for one test and restore them afterwards
+
+    Call with ``(target, name, value)`` tuples. A plain setattr/delattr pair is much
+    cheaper than entering a stack of ``unittest.mock.patch`` context managers.
+    """
+    originals: List[Tuple[Any, str, Any]] = []
+
+    def _patch(*patches: Tuple[Any, str, Any]) -> None:
+        for target, name, value in patches:
+            originals.append((target, name, vars(target).get(name, _MISSING)))
+            setattr(target, name, value)
+
+    yield _patch
+
+    for target, name, original in reversed(originals):
+        if original is _MISSING:
+            delattr(target, name)
+        else:
+            setattr(target, name, original)
+
+
+@pytest.fixture(autouse=True)
+def _no_save(request) -> None:
+    """Keep NotificationManager from writing its journal for tests marked no_save"""
+    if request.node.get_closest_marker("no_save"):
+        request.getfixturevalue("patch_attrs")(
+            (NotificationManager, "_append", lambda self, *args, **kwargs: None),
+            (NotificationManager, "save_notifications", lambda self: None),
+        )
 
 
 @pytest.fixture
-def temp_settings_file(temp_config_dir) -> Path:
-    """Create a temporary settings.json file"""
-    settings_file = temp_config_dir / "settings.json"
-    settings_data = {
-        "version": "1.0.0",
-        "discord": {
-            "monitored_channels": [123456789],
-            "movie_roles": [987654321],
-            "authorized_users": [],
-            "enable_dm_requests": True,
-            "auto_notify_requesters": True,
-            "notification_mode": "PrivateMessages",
-            "notification_channels": [],
-        },
-        "overseerr": {
-            "hostname": "localhost",
-            "port": 5055,
-            "use_ssl": False,
-        },
-        "movie_categories": [
-            {
-                "id": 1,
-                "name": "1080p",
-                "is_4k": False,
-                "service_id": 1,
-                "profile_id": 1,
-                "root_folder": "/movies",
-                "tags": [],
-            }
-        ],
-    }
+def temp_config_dir(tmp_path_factory) -> Path:
+    """Empty config directory for this test, unique even across reruns"""
+    return tmp_path_factory.mktemp("config")
+
+
+_SAMPLE_SETTINGS: Dict[str, Any] = {
+    "version": "1.0.0",
+    "discord": {
+        "monitored_channels": [123456789],
+        "movie_roles": [987654321],
+        "authorized_users": [],
+        "enable_dm_requests": True,
+        "auto_notify_requesters": True,
+        "notification_mode": "PrivateMessages",
+        "notification_channels": [],
+    },
+    "overseerr": {
+        "hostname": "localhost",
+        "port": 5055,
+        "use_ssl": False,
+    },
+    "movie_categories": [
+        {
+            "id": 1,
+            "name": "1080p",
+            "is_4k": False,
+            "service_id": 1,
+            "profile_id": 1,
+            "root_folder": "/movies",
+            "tags": [],
+        }
+    ],
+}
 
+
+def _write_settings_file(settings_file: Path) -> Path:
+    """Write sample settings.json content to the given path"""
     with open(settings_file, "w") as f:
-        json.dump(settings_data, f, indent=2)
+        json.dump(_SAMPLE_SETTINGS, f, indent=2)
 
     return settings_file
 
 
+@pytest.fixture
+def temp_settings_file(temp_config_dir) -> Path:
+    """Create a temporary settings.json file"""
+    return _write_settings_file(temp_config_dir / "settings.json")
+
+
+class MemoryFS:
+    """Dict-backed stand-in for the pathlib calls SettingsManager makes
+
+    Only paths under ``root`` live in memory; every other path goes to the real
+    filesystem, so .env lookups and pytest's own file access are unaffected.
+    """
+
+    root = Path("/memfs")
+    _PATCHED = ("exists", "mkdir", "read_bytes", "read_text", "write_bytes", "write_text")
+
+    def __init__(self) -> None:
+        self.files: Dict[Path, bytes] = {}
+        self.dirs = {self.root}
+        self._real = {name: getattr(Path, name) for name in self._PATCHED}
+
+    def _owns(self, path: Path) -> bool:
+        return path == self.root or self.root in path.parents
+
+    def exists(self, path: Path) -> bool:
+        return path in self.files or path in self.dirs
+
+    def mkdir(self, path: Path, mode: int = 0o777, parents: bool = False, exist_ok: bool = False):
+        if path in self.dirs and not exist_ok:
+            raise FileExistsError(str(path))
+        if path.parent not in self.dirs and not parents:
+            raise FileNotFoundError(str(path.parent))
+        self.dirs.update(p for p in (path, *path.parents) if self._owns(p))
+
+    def read_bytes(self, path: Path) -> bytes:
+        try:
+            return self.files[path]
+        except KeyError:
+            raise FileNotFoundError(str(path)) from None
+
+    def read_text(self, path: Path, encoding: str = "utf-8", errors: str = "strict") -> str:
+        return self.read_bytes(path).decode(encoding, errors)
+
+    def write_bytes(self, path: Path, data: bytes) -> int:
+        if path.parent not in self.dirs:
+            raise FileNotFoundError(str(path.parent))
+        self.files[path] = bytes(data)
+        return len(data)
+
+    def write_text(self, path: Path, data: str, encoding: str = "utf-8", **kwargs: Any) -> int:
+        return self.write_bytes(path, data.encode(encoding))
+
+    def read_json(self, path: Path) -> Any:
+        return json.loads(self.files[path])
+
+    def write_json(self, path: Path, data: Any) -> Path:
+        self.mkdir(path.parent, parents=True, exist_ok=True)
+        self.files[path] = json.dumps(data, indent=2).encode("utf-8")
+        return path
+
+    def patch(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        for name in self._PATCHED:
+            fake, real = getattr(self, name), self._real[name]
+
+            def dispatch(path, *args, _fake=fake, _real=real, **kwargs):
+                if self._owns(path):
+                    return _fake(path, *args, **kwargs)
+                return _real(path, *args, **kwargs)
+
+            monkeypatch.setattr(Path, name, dispatch)
+
+
+@pytest.fixture
+def memory_fs(monkeypatch) -> MemoryFS:
+    """In-memory filesystem for paths under MemoryFS.root"""
+    fs = MemoryFS()
+    fs.patch(monkeypatch)
+    return fs
+
+
+@pytest.fixture
+def memory_config_dir(memory_fs) -> Path:
+    """In-memory counterpart of temp_config_dir; each test gets a fresh MemoryFS"""
+    config_dir = memory_fs.root / "config"
+    memory_fs.mkdir(config_dir)
+    return config_dir
+
+
+@pytest.fixture
+def memory_settings_file(memory_fs, memory_config_dir) -> Path:
+    """In-memory counterpart of temp_settings_file"""
+    return memory_fs.write_json(memory_config_dir / "settings.json", _SAMPLE_SETTINGS)
+
+
 @pytest.fixture
 def bot_settings(mock_env_vars) -> BotSettings:
     """Create a BotSettings instance with test data"""
@@ -93,10 +336,112 @@ def bot_settings(mock_env_vars) -> BotSettings:
     return settings
 
 
+@pytest.fixture(scope="class")
+def default_settings() -> BotSettings:
+    """One BotSettings per test class, built from the ambient environment; read-only"""
+    return BotSettings()
+
+
+@pytest.fixture(scope="class")
+def env_settings() -> BotSettings:
+    """One BotSettings per test class, built from the mock_env_vars values; read-only"""
+    # BotSettings reads the environment in its constructor, so the variables only need
+    # to be set while it is built
+    with _patched_env(**_TEST_ENV_VARS):
+        return BotSettings()
+
+
+@pytest.fixture(scope="session")
+def settings_manager(tmp_path_factory) -> SettingsManager:
+    """SettingsManager over a session-wide sample settings file
+
+    Shared across tests, so only load() from it; tests that save should build their own
+    manager on temp_settings_file.
+    """
+    settings_file = _write_settings_file(tmp_path_factory.mktemp("config") / "settings.json")
+    return SettingsManager(config_path=str(settings_file))
+
+
+@pytest.fixture(scope="session")
+def cached_settings(tmp_path_factory) -> BotSettings:
+    """Settings loaded once per session from the sample settings file
+
+    Shared across tests, so treat as read-only; derive variants with dataclasses.replace.
+    """
+    settings_file = _write_settings_file(tmp_path_factory.mktemp("cached_config") / "settings.json")
+    return SettingsManager(config_path=str(settings_file)).load()
+
+
+@pytest.fixture(scope="module")
+def _shared_movie_bot(tmp_path_factory) -> MovieBot:
+    """Build one MovieBot per test module; construction is the expensive part
+
+    The bot never logs in, so discord.py has no HTTP session or gateway to tear down
+    and the fixture deliberately skips bot.close().
+    """
+    settings_file = _write_settings_file(tmp_path_factory.mktemp("bot_config") / "settings.json")
+    return MovieBot(SettingsManager(config_path=str(settings_file)))
+
+
+@pytest.fixture(scope="class")
+def shared_bot(settings_manager) -> MovieBot:
+    """One MovieBot per test class for tests that only read its attributes"""
+    return MovieBot(settings_manager)
+
+
+@pytest.fixture
+def movie_bot(_shared_movie_bot) -> MovieBot:
+    """Module-shared MovieBot with per-test state reset and extension loading stubbed"""
+    bot = _shared_movie_bot
+    bot.overseerr = None
+    bot.notifications = None
+    bot.load_extension = AsyncMock()
+    return bot
+
+
+@pytest.fixture(scope="session")
+def _template_overseerr_mock() -> AsyncMock:
+    """Spec'd OverseerrClient mock, built once per session; use overseerr_mock instead"""
+    return AsyncMock(spec=OverseerrClient)
+
+
+@pytest.fixture(scope="session")
+def _template_notification_mock() -> MagicMock:
+    """Spec'd NotificationManager mock, built once per session; use notification_mock instead"""
+    return MagicMock(spec=NotificationManager)
+
+
+@pytest.fixture
+def overseerr_mock(_template_overseerr_mock) -> AsyncMock:
+    """Session-cached OverseerrClient mock with calls, return values and side effects reset"""
+    _template_overseerr_mock.reset_mock(return_value=True, side_effect=True)
+    return _template_overseerr_mock
+
+
+@pytest.fixture
+def overseerr(mock_discord_bot, overseerr_mock) -> AsyncMock:
+    """Spec'd OverseerrClient mock installed as mock_discord_bot.overseerr"""
+    mock_discord_bot.overseerr = overseerr_mock
+    return overseerr_mock
+
+
 @pytest.fixture
-def settings_manager(temp_settings_file) -> SettingsManager:
-    """Create a SettingsManager instance with temp file"""
-    return SettingsManager(config_path=str(temp_settings_file))
+def notification_mock(_template_notification_mock) -> MagicMock:
+    """Session-cached NotificationManager mock with calls, return values and side effects reset"""
+    _template_notification_mock.reset_mock(return_value=True, side_effect=True)
+    return _template_notification_mock
+
+
+@pytest.fixture(scope="class")
+def patched_setup_hook_deps() -> Generator[Tuple[MagicMock, MagicMock], None, None]:
+    """Patch bot.main's OverseerrClient and NotificationManager once per test class
+
+    Yields the (client class, notification manager class) mocks; reset them before use.
+    """
+    with contextlib.ExitStack() as stack:
+        mock_client_class = stack.enter_context(patch("bot.main.OverseerrClient"))
+        mock_notif_class = stack.enter_context(patch("bot.main.NotificationManager"))
+        yield mock_client_class, mock_notif_class
 
 
 @pytest.fixture
@@ -116,9 +461,9 @@ def discord_settings() -> DiscordSettings:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def overseerr_settings() -> OverseerrSettings:
-    """Create an OverseerrSettings instance"""
+    """OverseerrSettings for the test server; shared per session, so treat as read-only"""
     return OverseerrSettings(
         hostname="test.overseerr.local",
         port=5055,
@@ -128,9 +473,9 @@ def overseerr_settings() -> OverseerrSettings:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 async def overseerr_client(overseerr_settings) -> AsyncGenerator[OverseerrClient, None]:
-    """Create an OverseerrClient instance"""
+    """OverseerrClient shared by a test class; its HTTP session is closed after the class"""
     client = OverseerrClient(
         hostname=overseerr_settings.hostname,
         port=overseerr_settings.port,
@@ -141,13 +486,68 @@ async def overseerr_client(overseerr_settings) -> AsyncGenerator[OverseerrClient
     await client.close()
 
 
-@pytest.fixture
-def mock_aiohttp() -> Generator[aioresponses, None, None]:
-    """Mock aiohttp responses"""
+@pytest.fixture(scope="session")
+def overseerr_urls(overseerr_settings) -> Mapping[str, Union[str, Pattern[str]]]:
+    """Mock-registration URLs for the test server, built once per session
+
+    Search is a compiled pattern matching any query, so tests needn't rebuild the
+    encoded query string.
+    """
+    base_url = OverseerrClient(
+        hostname=overseerr_settings.hostname,
+        port=overseerr_settings.port,
+        api_key="",
+        use_ssl=overseerr_settings.use_ssl,
+    ).base_url
+    return MappingProxyType(
+        {
+            "settings_main": f"{base_url}settings/main",
+            # aioresponses sorts query parameters before matching
+            "search": re.compile(
+                re.escape(f"{base_url}search?language=en&page=1&query=") + r"[^&]*$"
+            ),
+            "movie_550": f"{base_url}movie/550",
+            "movie_999999": f"{base_url}movie/999999",
+            "request": f"{base_url}request",
+        }
+    )
+
+
+@pytest.fixture(scope="class")
+def _class_aioresponses() -> Generator[aioresponses, None, None]:
+    """aioresponses patch held open for a whole test class; use mock_aiohttp instead"""
     with aioresponses() as m:
         yield m
 
 
+@pytest.fixture
+def mock_aiohttp(_class_aioresponses) -> aioresponses:
+    """Mock aiohttp responses, with anything registered or recorded by earlier tests cleared"""
+    # clear() drops registered responses but not the recorded requests
+    _class_aioresponses.clear()
+    _class_aioresponses.requests.clear()
+    return _class_aioresponses
+
+
+@pytest.fixture
+def mock_endpoint(request, mock_aiohttp, overseerr_urls) -> aioresponses:
+    """mock_aiohttp with one response registered from an indirect parametrize
+
+    The param is ``(method, url_key, status, payload)``: url_key indexes overseerr_urls
+    and a str payload names the fixture whose value is the response body. Bytes are
+    sent as an already-serialised JSON body.
+    """
+    method, url_key, status, payload = request.param
+    if isinstance(payload, str):
+        payload = request.getfixturevalue(payload)
+    if isinstance(payload, bytes):
+        response = {"body": payload}
+    else:
+        response = {"payload": dict(payload)}
+    getattr(mock_aiohttp, method)(overseerr_urls[url_key], status=status, **response)
+    return mock_aiohttp
+
+
 @pytest.fixture
 def sample_movie_data() -> Dict[str, Any]:
     """Sample movie data from Overseerr API"""
@@ -184,9 +584,9 @@ def sample_tv_data() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_movie() -> Movie:
-    """Create a sample Movie object"""
+    """Sample available Movie; shared per session, so treat as read-only"""
     return Movie(
         tmdb_id=550,
         title="Fight Club",
@@ -201,9 +601,24 @@ def sample_movie() -> Movie:
     )
 
 
-@pytest.fixture
+_MOVIE_DEFAULTS: Dict[str, Any] = {
+    "tmdb_id": 1,
+    "title": "Test",
+    "overview": "Test",
+    "release_date": "2024-01-01",
+    "poster_path": None,
+}
+
+
+@pytest.fixture(scope="session")
+def movie_factory() -> Callable[..., Movie]:
+    """Build a minimal Movie, with keyword arguments overriding the placeholder fields"""
+    return lambda **overrides: Movie(**{**_MOVIE_DEFAULTS, **overrides})
+
+
+@pytest.fixture(scope="session")
 def sample_tv_show() -> TVShow:
-    """Create a sample TVShow object"""
+    """Sample pending TVShow; shared per session, so treat as read-only"""
     return TVShow(
         tmdb_id=1396,
         name="Breaking Bad",
@@ -218,6 +633,61 @@ def sample_tv_show() -> TVShow:
     )
 
 
+@pytest.fixture(scope="module")
+def movie_requestable() -> Movie:
+    """Fight Club, neither available nor requested; shared per module, so treat as read-only"""
+    return Movie(
+        tmdb_id=550,
+        title="Fight Club",
+        overview="Test",
+        release_date="1999-10-15",
+        poster_path=None,
+        available=False,
+        requested=False,
+    )
+
+
+@pytest.fixture(scope="module")
+def movie_available(movie_requestable) -> Movie:
+    """Fight Club, already available"""
+    return dataclasses.replace(movie_requestable, available=True, status=MediaStatus.AVAILABLE)
+
+
+@pytest.fixture(scope="module")
+def movie_requested(movie_requestable) -> Movie:
+    """Fight Club, already requested and pending"""
+    return dataclasses.replace(movie_requestable, requested=True, status=MediaStatus.PENDING)
+
+
+@pytest.fixture(scope="module")
+def tv_requestable() -> TVShow:
+    """Breaking Bad, neither available nor requested; shared per module, so treat as read-only"""
+    return TVShow(
+        tmdb_id=1396,
+        name="Breaking Bad",
+        overview="Test",
+        first_air_date="2008-01-20",
+        poster_path=None,
+        available=False,
+        requested=False,
+    )
+
+
+@pytest.fixture(scope="module")
+def many_movies() -> List[Movie]:
+    """26 movies, one more than Discord allows in a select menu"""
+    return [
+        Movie(
+            tmdb_id=i,
+            title=f"Movie {i}",
+            overview=f"Overview {i}",
+            release_date="2024-01-01",
+            poster_path=None,
+        )
+        for i in range(26)
+    ]
+
+
 @pytest.fixture
 def mock_discord_bot() -> MagicMock:
     """Create a mock Discord bot"""
@@ -239,26 +709,92 @@ def mock_discord_bot() -> MagicMock:
 
 
 @pytest.fixture
-def mock_discord_interaction() -> AsyncMock:
-    """Create a mock Discord interaction"""
+def movie_cog(mock_discord_bot) -> MovieCommands:
+    """MovieCommands cog bound to the per-test mock bot"""
+    return MovieCommands(mock_discord_bot)
+
+
+@pytest.fixture
+async def selection_callback(movie_cog, mock_discord_interaction, sample_movie):
+    """Select-menu callback from a media selection shown for sample_movie"""
+    await movie_cog._show_media_selection(mock_discord_interaction, [sample_movie])
+    view = mock_discord_interaction.followup.send.call_args.kwargs["view"]
+    return view.children[0].callback
+
+
+@pytest.fixture(scope="module")
+def _module_discord_interaction() -> AsyncMock:
+    """Mock interaction built once per module; use mock_discord_interaction instead"""
     interaction = AsyncMock()
     interaction.user = MagicMock()
-    interaction.user.id = 111
-    interaction.user.name = "TestUser"
-    interaction.user.mention = "@TestUser"
     interaction.guild = MagicMock()
-    interaction.guild.id = 999
     interaction.response = AsyncMock()
     interaction.followup = AsyncMock()
     interaction.edit_original_response = AsyncMock()
+    return interaction
+
+
+@pytest.fixture
+def mock_discord_interaction(_module_discord_interaction) -> AsyncMock:
+    """Create a mock Discord interaction
+
+    The AsyncMock graph is expensive to build, so it is shared per module: calls, return
+    values and side effects are reset and the plain attributes tests change are restored.
+    """
+    interaction = _module_discord_interaction
+    interaction.reset_mock(return_value=True, side_effect=True)
+    interaction.user.id = 111
+    interaction.user.name = "TestUser"
+    interaction.user.mention = "@TestUser"
+    interaction.guild.id = 999
 
     return interaction
 
 
 @pytest.fixture
-def mock_notification_file(temp_config_dir) -> Path:
-    """Create a temporary notifications.json file"""
-    notifications_file = temp_config_dir / "notifications.json"
+def notification_manager(mock_discord_bot, temp_config_dir) -> NotificationManager:
+    """NotificationManager backed by a not-yet-existing notifications.json in temp_config_dir"""
+    return NotificationManager(
+        bot=mock_discord_bot,
+        notifications_file=str(temp_config_dir / "notifications.json"),
+    )
+
+
+@pytest.fixture
+def notification_bot(mock_discord_bot, overseerr, sample_movie) -> Tuple[MagicMock, MagicMock]:
+    """mock_discord_bot wired for notification checks, plus the user fetch_user returns
+
+    overseerr.get_movie_by_id returns sample_movie; override return_value/side_effect as needed.
+    """
+    overseerr.get_movie_by_id.return_value = sample_movie
+
+    user = MagicMock()
+    user.id = 111
+    user.name = "TestUser"
+    user.send = AsyncMock()
+    mock_discord_bot.fetch_user = AsyncMock(return_value=user)
+
+    return mock_discord_bot, user
+
+
+@pytest.fixture(scope="module")
+def sample_pending_request() -> PendingRequest:
+    """Pending Fight Club request from TestUser; shared per module, so treat as read-only"""
+    return PendingRequest(
+        user_id=111,
+        username="TestUser",
+        tmdb_id=550,
+        title="Fight Club",
+        timestamp="2026-02-01T12:00:00",
+        is_4k=False,
+        last_status=MediaStatus.PENDING,
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_notification_file(tmp_path_factory) -> Path:
+    """notifications.json with one pending request; shared per session, so treat as read-only"""
+    notifications_file = tmp_path_factory.mktemp("notifications") / "notifications.json"
     notifications_data = {
         "111:550": {
             "user_id": 111,
@@ -277,83 +813,111 @@ def mock_notification_file(temp_config_dir) -> Path:
     return notifications_file
 
 
-@pytest.fixture
-def overseerr_search_response() -> Dict[str, Any]:
-    """Sample search response from Overseerr API"""
-    return {
-        "page": 1,
-        "totalPages": 1,
-        "totalResults": 2,
-        "results": [
-            {
-                "id": 550,
-                "title": "Fight Club",
-                "overview": "A ticking-time-bomb insomniac...",
-                "releaseDate": "1999-10-15",
-                "posterPath": "/pB8BM7pdSp6B6Ih7QZ4DrQ3PmJK.jpg",
-                "mediaType": "movie",
-                "popularity": 67.634,
-                "mediaInfo": {
-                    "status": 5,
-                    "status4k": 1,
-                },
+# Overseerr payloads shared by the session-scoped fixtures below. The fixtures hand out
+# MappingProxyType views, which only guard the top level; tests that edit nested values
+# take mutable_movie_details instead.
+_SEARCH_RESPONSE: Dict[str, Any] = {
+    "page": 1,
+    "totalPages": 1,
+    "totalResults": 2,
+    "results": [
+        {
+            "id": 550,
+            "title": "Fight Club",
+            "overview": "A ticking-time-bomb insomniac...",
+            "releaseDate": "1999-10-15",
+            "posterPath": "/pB8BM7pdSp6B6Ih7QZ4DrQ3PmJK.jpg",
+            "mediaType": "movie",
+            "popularity": 67.634,
+            "mediaInfo": {
+                "status": 5,
+                "status4k": 1,
             },
-            {
-                "id": 1396,
-                "name": "Breaking Bad",
-                "overview": "A high school chemistry teacher...",
-                "firstAirDate": "2008-01-20",
-                "posterPath": "/ggFHVNu6YYI5L9pCfOacjizRGt.jpg",
-                "mediaType": "tv",
-                "popularity": 456.789,
-                "mediaInfo": {
-                    "status": 2,
-                    "status4k": 1,
-                },
+        },
+        {
+            "id": 1396,
+            "name": "Breaking Bad",
+            "overview": "A high school chemistry teacher...",
+            "firstAirDate": "2008-01-20",
+            "posterPath": "/ggFHVNu6YYI5L9pCfOacjizRGt.jpg",
+            "mediaType": "tv",
+            "popularity": 456.789,
+            "mediaInfo": {
+                "status": 2,
+                "status4k": 1,
             },
-        ],
-    }
+        },
+    ],
+}
+
+_MOVIE_DETAILS_RESPONSE: Dict[str, Any] = {
+    "id": 550,
+    "title": "Fight Club",
+    "overview": "A ticking-time-bomb insomniac...",
+    "releaseDate": "1999-10-15",
+    "posterPath": "/pB8BM7pdSp6B6Ih7QZ4DrQ3PmJK.jpg",
+    "mediaType": "movie",
+    "popularity": 67.634,
+    "mediaInfo": {
+        "status": 5,
+        "status4k": 1,
+        "requests": [],
+    },
+    "cast": [
+        {"name": "Brad Pitt"},
+        {"name": "Edward Norton"},
+        {"name": "Helena Bonham Carter"},
+    ],
+}
+
+_REQUEST_SUCCESS_RESPONSE: Dict[str, Any] = {
+    "id": 1,
+    "status": 2,  # PENDING
+    "createdAt": "2026-02-08T12:00:00.000Z",
+    "updatedAt": "2026-02-08T12:00:00.000Z",
+    "type": "movie",
+    "is4k": False,
+    "media": {
+        "tmdbId": 550,
+        "status": 2,
+    },
+}
+
+
+@pytest.fixture(scope="session")
+def overseerr_search_response() -> Mapping[str, Any]:
+    """Sample search response from Overseerr API, shared read-only across the session"""
+    return MappingProxyType(_SEARCH_RESPONSE)
+
+
+@pytest.fixture(scope="session")
+def overseerr_movie_details_response() -> Mapping[str, Any]:
+    """Sample movie details response from Overseerr API, shared read-only across the session"""
+    return MappingProxyType(_MOVIE_DETAILS_RESPONSE)
+
+
+@pytest.fixture(scope="session")
+def overseerr_search_response_bytes() -> bytes:
+    """overseerr_search_response serialised once, for mocks that take a raw body"""
+    return json.dumps(_SEARCH_RESPONSE).encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def overseerr_movie_details_response_bytes() -> bytes:
+    """overseerr_movie_details_response serialised once, for mocks that take a raw body"""
+    return json.dumps(_MOVIE_DETAILS_RESPONSE).encode("utf-8")
 
 
 @pytest.fixture
-def overseerr_movie_details_response() -> Dict[str, Any]:
-    """Sample movie details response from Overseerr API"""
-    return {
-        "id": 550,
-        "title": "Fight Club",
-        "overview": "A ticking-time-bomb insomniac...",
-        "releaseDate": "1999-10-15",
-        "posterPath": "/pB8BM7pdSp6B6Ih7QZ4DrQ3PmJK.jpg",
-        "mediaType": "movie",
-        "popularity": 67.634,
-        "mediaInfo": {
-            "status": 5,
-            "status4k": 1,
-            "requests": [],
-        },
-        "cast": [
-            {"name": "Brad Pitt"},
-            {"name": "Edward Norton"},
-            {"name": "Helena Bonham Carter"},
-        ],
-    }
+def mutable_movie_details() -> Dict[str, Any]:
+    """Private deep copy of the movie details response for tests that edit it"""
+    return copy.deepcopy(_MOVIE_DETAILS_RESPONSE)
 
 
-@pytest.fixture
-def overseerr_request_success_response() -> Dict[str, Any]:
-    """Sample successful request response from Overseerr API"""
-    return {
-        "id": 1,
-        "status": 2,  # PENDING
-        "createdAt": "2026-02-08T12:00:00.000Z",
-        "updatedAt": "2026-02-08T12:00:00.000Z",
-        "type": "movie",
-        "is4k": False,
-        "media": {
-            "tmdbId": 550,
-            "status": 2,
-        },
-    }
+@pytest.fixture(scope="session")
+def overseerr_request_success_response() -> Mapping[str, Any]:
+    """Sample successful request response from Overseerr API, shared read-only across the session"""
+    return MappingProxyType(_REQUEST_SUCCESS_RESPONSE)
 
 
 # Helper functions for tests
@@ -1,28 +1,52 @@
 """Unit tests for Discord slash commands in movie_commands.py"""
 
+import dataclasses
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import discord
 from discord import app_commands
 
-from bot.cogs.movie_commands import MovieCommands
-from bot.overseerr import Movie, TVShow, MediaStatus, MovieRequestResult
+from bot.cogs.movie_commands import MovieCommands, setup
+from bot.overseerr import MovieRequestResult
+
+pytestmark = pytest.mark.unit
+
+GREEN = discord.Color.green()
+RED = discord.Color.red()
+ORANGE = discord.Color.orange()
+BLUE = discord.Color.blue()
+VIEW_CLS = discord.ui.View
+SELECT_CLS = discord.ui.Select
+BUTTON_CLS = discord.ui.Button
+
+
+def _button_callback_from(interaction):
+    """Callback of the first button in the view last sent via edit_original_response"""
+    view = interaction.edit_original_response.call_args.kwargs["view"]
+    return view.children[0].callback
+
+
+def _make_interaction(user_id, username="TestUser"):
+    """Mock component interaction from the given user"""
+    interaction = AsyncMock()
+    interaction.user.id = user_id
+    interaction.user.name = username
+    interaction.response = AsyncMock()
+    return interaction
 
 
-@pytest.mark.unit
 class TestPingCommand:
     """Test /ping command"""
 
-    @pytest.mark.asyncio
-    async def test_ping_command(self, mock_discord_bot, mock_discord_interaction):
+    async def test_ping_command(self, movie_cog, mock_discord_bot, mock_discord_interaction):
         """Test ping command responds with latency"""
         # Setup
-        cog = MovieCommands(mock_discord_bot)
         mock_discord_bot.latency = 0.045  # 45ms
 
         # Execute
-        await cog.ping.callback(cog, mock_discord_interaction)
+        await movie_cog.ping.callback(movie_cog, mock_discord_interaction)
 
         # Verify
         mock_discord_interaction.response.send_message.assert_called_once()
@@ -32,23 +56,22 @@ class TestPingCommand:
         embed = call_args.kwargs["embed"]
         assert "Pong!" in embed.title
         assert "45ms" in embed.description
-        assert embed.color == discord.Color.green()
+        assert embed.color == GREEN
         assert call_args.kwargs["ephemeral"] is True
 
 
-@pytest.mark.unit
 class TestHelpCommand:
     """Test /help command"""
 
-    @pytest.mark.asyncio
-    async def test_help_command_no_authorization(self, mock_discord_bot, mock_discord_interaction):
+    async def test_help_command_no_authorization(
+        self, movie_cog, mock_discord_bot, mock_discord_interaction
+    ):
         """Test help command without authorization whitelist"""
         # Setup
         mock_discord_bot.settings.discord.authorized_users = []
-        cog = MovieCommands(mock_discord_bot)
 
         # Execute
-        await cog.help_command.callback(cog, mock_discord_interaction)
+        await movie_cog.help_command.callback(movie_cog, mock_discord_interaction)
 
         # Verify
         mock_discord_interaction.response.send_message.assert_called_once()
@@ -66,17 +89,15 @@ class TestHelpCommand:
 
         assert call_args.kwargs["ephemeral"] is True
 
-    @pytest.mark.asyncio
     async def test_help_command_with_authorization(
-        self, mock_discord_bot, mock_discord_interaction
+        self, movie_cog, mock_discord_bot, mock_discord_interaction
     ):
         """Test help command with authorization whitelist enabled"""
         # Setup
         mock_discord_bot.settings.discord.authorized_users = [111, 222, 333]
-        cog = MovieCommands(mock_discord_bot)
 
         # Execute
-        await cog.help_command.callback(cog, mock_discord_interaction)
+        await movie_cog.help_command.callback(movie_cog, mock_discord_interaction)
 
         # Verify
         call_args = mock_discord_interaction.response.send_message.call_args
@@ -87,46 +108,40 @@ class TestHelpCommand:
         assert any("Authorization" in name for name in field_names)
 
 
-@pytest.mark.unit
 class TestOverseerrHealthCommand:
     """Test /overseerr-health command"""
 
-    @pytest.mark.asyncio
-    async def test_overseerr_health_success(self, mock_discord_bot, mock_discord_interaction):
+    async def test_overseerr_health_success(
+        self, movie_cog, overseerr, mock_discord_bot, mock_discord_interaction
+    ):
         """Test health check with successful connection"""
         # Setup
-        cog = MovieCommands(mock_discord_bot)
-        mock_discord_bot.overseerr = AsyncMock()
-        mock_discord_bot.overseerr.test_connection = AsyncMock()
         mock_discord_bot.settings.overseerr.hostname = "test.overseerr.local"
 
         # Execute
-        await cog.overseerr_health.callback(cog, mock_discord_interaction)
+        await movie_cog.overseerr_health.callback(movie_cog, mock_discord_interaction)
 
         # Verify
         mock_discord_interaction.response.defer.assert_called_once_with(ephemeral=True)
-        mock_discord_bot.overseerr.test_connection.assert_called_once()
+        overseerr.test_connection.assert_called_once()
 
         call_args = mock_discord_interaction.followup.send.call_args
         embed = call_args.kwargs["embed"]
         assert "Health Check" in embed.title
         assert "✅" in embed.title
-        assert embed.color == discord.Color.green()
+        assert embed.color == GREEN
         assert "Connected" in str(embed.fields)
 
-    @pytest.mark.asyncio
-    async def test_overseerr_health_failure(self, mock_discord_bot, mock_discord_interaction):
+    async def test_overseerr_health_failure(
+        self, movie_cog, overseerr, mock_discord_bot, mock_discord_interaction
+    ):
         """Test health check with connection failure"""
         # Setup
-        cog = MovieCommands(mock_discord_bot)
-        mock_discord_bot.overseerr = AsyncMock()
-        mock_discord_bot.overseerr.test_connection = AsyncMock(
-            side_effect=Exception("Connection refused")
-        )
+        overseerr.test_connection.side_effect = Exception("Connection refused")
         mock_discord_bot.settings.overseerr.hostname = "test.overseerr.local"
 
         # Execute
-        await cog.overseerr_health.callback(cog, mock_discord_interaction)
+        await movie_cog.overseerr_health.callback(movie_cog, mock_discord_interaction)
 
         # Verify
         mock_discord_interaction.response.defer.assert_called_once_with(ephemeral=True)
@@ -134,201 +149,127 @@ class TestOverseerrHealthCommand:
         embed = call_args.kwargs["embed"]
         assert "Failed" in embed.title
         assert "❌" in embed.title
-        assert embed.color == discord.Color.red()
+        assert embed.color == RED
         assert "Connection refused" in str(embed.fields)
 
 
-@pytest.mark.unit
 class TestRequestCommand:
     """Test /request command"""
 
-    @pytest.mark.asyncio
-    async def test_request_unauthorized_user(self, mock_discord_bot, mock_discord_interaction):
-        """Test request command rejects unauthorized user"""
-        # Setup
-        mock_discord_bot.settings.discord.authorized_users = [222, 333]  # Not including 111
-        mock_discord_interaction.user.id = 111  # User not in whitelist
-        cog = MovieCommands(mock_discord_bot)
-
-        # Execute
-        await cog.request_media.callback(cog, mock_discord_interaction, "Fight Club")
-
-        # Verify
-        mock_discord_interaction.response.defer.assert_called_once_with(ephemeral=True)
-        call_args = mock_discord_interaction.followup.send.call_args
-        embed = call_args.kwargs["embed"]
-        assert "Not Authorized" in embed.title
-        assert "🚫" in embed.title
-        assert embed.color == discord.Color.red()
-
-    @pytest.mark.asyncio
-    async def test_request_authorized_user(
-        self, mock_discord_bot, mock_discord_interaction, sample_movie
-    ):
-        """Test request command allows authorized user"""
-        # Setup
-        mock_discord_bot.settings.discord.authorized_users = [111, 222, 333]
-        mock_discord_interaction.user.id = 111  # User in whitelist
-        mock_discord_bot.overseerr = AsyncMock()
-        mock_discord_bot.overseerr.search_media = AsyncMock(return_value=[sample_movie])
-
-        cog = MovieCommands(mock_discord_bot)
-
-        # Execute
-        await cog.request_media.callback(cog, mock_discord_interaction, "Fight Club")
-
-        # Verify authorized user can proceed
-        mock_discord_bot.overseerr.search_media.assert_called_once_with("Fight Club")
-
-    @pytest.mark.asyncio
-    async def test_request_no_authorization_list(
-        self, mock_discord_bot, mock_discord_interaction, sample_movie
-    ):
-        """Test request command when no authorization whitelist is set (all users allowed)"""
-        # Setup
-        mock_discord_bot.settings.discord.authorized_users = []  # Empty = all allowed
-        mock_discord_bot.overseerr = AsyncMock()
-        mock_discord_bot.overseerr.search_media = AsyncMock(return_value=[sample_movie])
-
-        cog = MovieCommands(mock_discord_bot)
-
-        # Execute
-        await cog.request_media.callback(cog, mock_discord_interaction, "Fight Club")
-
-        # Verify search was called (user was allowed)
-        mock_discord_bot.overseerr.search_media.assert_called_once_with("Fight Club")
-
-    @pytest.mark.asyncio
-    async def test_request_no_results(self, mock_discord_bot, mock_discord_interaction):
-        """Test request command when no results found"""
-        # Setup
-        mock_discord_bot.settings.discord.authorized_users = []
-        mock_discord_bot.overseerr = AsyncMock()
-        mock_discord_bot.overseerr.search_media = AsyncMock(return_value=[])
-
-        cog = MovieCommands(mock_discord_bot)
-
-        # Execute
-        await cog.request_media.callback(cog, mock_discord_interaction, "NonexistentMovie12345")
-
-        # Verify
-        call_args = mock_discord_interaction.followup.send.call_args
-        embed = call_args.kwargs["embed"]
-        assert "No Results" in embed.title
-        assert "❌" in embed.title
-        assert "NonexistentMovie12345" in embed.description
-
-    @pytest.mark.asyncio
-    async def test_request_single_result_movie(
-        self, mock_discord_bot, mock_discord_interaction, sample_movie
-    ):
-        """Test request command with single movie result"""
-        # Setup
-        mock_discord_bot.settings.discord.authorized_users = []
-        mock_discord_bot.overseerr = AsyncMock()
-        mock_discord_bot.overseerr.search_media = AsyncMock(return_value=[sample_movie])
-
-        cog = MovieCommands(mock_discord_bot)
-
-        with patch.object(cog, "_show_media_details", new_callable=AsyncMock) as mock_show_details:
-            # Execute
-            await cog.request_media.callback(cog, mock_discord_interaction, "Fight Club")
-
-            # Verify it shows details directly for single result
-            mock_show_details.assert_called_once_with(mock_discord_interaction, sample_movie)
-
-    @pytest.mark.asyncio
-    async def test_request_single_result_tv(
-        self, mock_discord_bot, mock_discord_interaction, sample_tv_show
+    @pytest.mark.parametrize(
+        "authorized,query,search,expect",
+        [
+            ([222, 333], "Fight Club", [], "not_authorized"),
+            ([111, 222, 333], "Fight Club", ["movie"], "searched"),
+            ([], "Fight Club", ["movie"], "searched"),
+            ([], "NonexistentMovie12345", [], "no_results"),
+            ([], "Fight Club", ["movie"], "details"),
+            ([], "Breaking Bad", ["tv"], "details"),
+            ([], "Fight", ["movie", "tv"], "selection"),
+            ([], "Fight Club", Exception("API Error"), "error"),
+        ],
+        ids=[
+            "unauthorized_user",
+            "authorized_user",
+            "no_authorization_list",
+            "no_results",
+            "single_result_movie",
+            "single_result_tv",
+            "multiple_results",
+            "error_handling",
+        ],
+    )
+    async def test_request_media_dispatch(
+        self,
+        authorized,
+        query,
+        search,
+        expect,
+        movie_cog,
+        overseerr,
+        mock_discord_bot,
+        mock_discord_interaction,
+        sample_movie,
+        sample_tv_show,
     ):
-        """Test request command with single TV show result"""
-        # Setup
-        mock_discord_bot.settings.discord.authorized_users = []
-        mock_discord_bot.overseerr = AsyncMock()
-        mock_discord_bot.overseerr.search_media = AsyncMock(return_value=[sample_tv_show])
-
-        cog = MovieCommands(mock_discord_bot)
-
-        with patch.object(cog, "_show_media_details", new_callable=AsyncMock) as mock_show_details:
-            # Execute
-            await cog.request_media.callback(cog, mock_discord_interaction, "Breaking Bad")
-
-            # Verify
-            mock_show_details.assert_called_once_with(mock_discord_interaction, sample_tv_show)
-
-    @pytest.mark.asyncio
-    async def test_request_multiple_results(
-        self, mock_discord_bot, mock_discord_interaction, sample_movie, sample_tv_show
-    ):
-        """Test request command with multiple results shows dropdown"""
-        # Setup
-        mock_discord_bot.settings.discord.authorized_users = []
-        mock_discord_bot.overseerr = AsyncMock()
-        mock_discord_bot.overseerr.search_media = AsyncMock(
-            return_value=[sample_movie, sample_tv_show]
-        )
-
-        cog = MovieCommands(mock_discord_bot)
-
-        with patch.object(
-            cog, "_show_media_selection", new_callable=AsyncMock
-        ) as mock_show_selection:
+        """Test request command authorization and dispatch on the number of search results"""
+        # Setup - the interaction user is 111; an empty whitelist allows everyone
+        mock_discord_bot.settings.discord.authorized_users = authorized
+        mock_discord_interaction.user.id = 111
+
+        if isinstance(search, Exception):
+            results = None
+            overseerr.search_media.side_effect = search
+        else:
+            media = {"movie": sample_movie, "tv": sample_tv_show}
+            results = [media[kind] for kind in search]
+            overseerr.search_media.return_value = results
+
+        with (
+            patch.object(
+                movie_cog, "_show_media_details", new_callable=AsyncMock
+            ) as mock_show_details,
+            patch.object(
+                movie_cog, "_show_media_selection", new_callable=AsyncMock
+            ) as mock_show_selection,
+        ):
             # Execute
-            await cog.request_media.callback(cog, mock_discord_interaction, "Fight")
+            await movie_cog.request_media.callback(movie_cog, mock_discord_interaction, query)
 
-            # Verify selection dropdown is shown
-            mock_show_selection.assert_called_once()
-            call_args = mock_show_selection.call_args
-            assert call_args[0][0] == mock_discord_interaction
-            assert len(call_args[0][1]) == 2  # Both movie and TV show
-
-    @pytest.mark.asyncio
-    async def test_request_error_handling(self, mock_discord_bot, mock_discord_interaction):
-        """Test request command handles errors gracefully"""
-        # Setup
-        mock_discord_bot.settings.discord.authorized_users = []
-        mock_discord_bot.overseerr = AsyncMock()
-        mock_discord_bot.overseerr.search_media = AsyncMock(side_effect=Exception("API Error"))
-
-        cog = MovieCommands(mock_discord_bot)
-
-        # Execute
-        await cog.request_media.callback(cog, mock_discord_interaction, "Fight Club")
+        # Verify
+        mock_discord_interaction.response.defer.assert_called_once_with(ephemeral=True)
 
-        # Verify error message shown
-        call_args = mock_discord_interaction.followup.send.call_args
-        embed = call_args.kwargs["embed"]
-        assert "Error" in embed.title
-        assert "❌" in embed.title
-        assert "API Error" in embed.description
+        if expect == "not_authorized":
+            embed = mock_discord_interaction.followup.send.call_args.kwargs["embed"]
+            assert "Not Authorized" in embed.title
+            assert "🚫" in embed.title
+            assert embed.color == RED
+            overseerr.search_media.assert_not_called()
+        elif expect == "searched":
+            # Authorized user can proceed
+            overseerr.search_media.assert_called_once_with(query)
+        elif expect == "no_results":
+            embed = mock_discord_interaction.followup.send.call_args.kwargs["embed"]
+            assert "No Results" in embed.title
+            assert "❌" in embed.title
+            assert query in embed.description
+        elif expect == "details":
+            # A single result skips the dropdown and shows details directly
+            mock_show_details.assert_called_once_with(mock_discord_interaction, results[0])
+            mock_show_selection.assert_not_called()
+        elif expect == "selection":
+            mock_show_selection.assert_called_once_with(mock_discord_interaction, results)
+            mock_show_details.assert_not_called()
+        elif expect == "error":
+            embed = mock_discord_interaction.followup.send.call_args.kwargs["embed"]
+            assert "Error" in embed.title
+            assert "❌" in embed.title
+            assert "API Error" in embed.description
 
 
-@pytest.mark.unit
 class TestShowMediaSelection:
     """Test _show_media_selection method"""
 
-    @pytest.mark.asyncio
     async def test_show_media_selection_movies_and_tv(
-        self, mock_discord_bot, mock_discord_interaction, sample_movie, sample_tv_show
+        self, movie_cog, mock_discord_interaction, sample_movie, sample_tv_show
     ):
         """Test media selection dropdown with both movies and TV shows"""
         # Setup
-        cog = MovieCommands(mock_discord_bot)
         media_items = [sample_movie, sample_tv_show]
 
         # Execute
-        await cog._show_media_selection(mock_discord_interaction, media_items)
+        await movie_cog._show_media_selection(mock_discord_interaction, media_items)
 
         # Verify
         call_args = mock_discord_interaction.followup.send.call_args
         assert "select" in call_args[0][0].lower()
 
         view = call_args.kwargs["view"]
-        assert isinstance(view, discord.ui.View)
+        assert isinstance(view, VIEW_CLS)
 
         # Check that view has a select menu
         select_menu = view.children[0]
-        assert isinstance(select_menu, discord.ui.Select)
+        assert isinstance(select_menu, SELECT_CLS)
         assert len(select_menu.options) == 2
 
         # Check options have correct format
@@ -342,249 +283,141 @@ class TestShowMediaSelection:
         assert "Breaking Bad" in tv_option.label
         assert "tv:" in tv_option.value
 
-    @pytest.mark.asyncio
     async def test_show_media_selection_truncation(
-        self, mock_discord_bot, mock_discord_interaction
+        self, movie_cog, mock_discord_interaction, many_movies
     ):
         """Test media selection dropdown truncates to 25 items (Discord limit)"""
-        # Setup
-        cog = MovieCommands(mock_discord_bot)
-
-        # Create 30 movies
-        media_items = []
-        for i in range(30):
-            movie = Movie(
-                tmdb_id=i,
-                title=f"Movie {i}",
-                overview=f"Overview {i}",
-                release_date="2024-01-01",
-                poster_path=None,
-            )
-            media_items.append(movie)
-
-        # Execute
-        await cog._show_media_selection(mock_discord_interaction, media_items)
+        await movie_cog._show_media_selection(mock_discord_interaction, many_movies)
 
         # Verify only 25 options (Discord limit)
         view = mock_discord_interaction.followup.send.call_args.kwargs["view"]
         select_menu = view.children[0]
         assert len(select_menu.options) == 25
 
-    @pytest.mark.asyncio
-    async def test_media_selection_callback_wrong_user(
-        self, mock_discord_bot, mock_discord_interaction, sample_movie
-    ):
-        """Test media selection callback rejects wrong user"""
-        # Setup
-        cog = MovieCommands(mock_discord_bot)
-        mock_discord_bot.overseerr = AsyncMock()
-
-        await cog._show_media_selection(mock_discord_interaction, [sample_movie])
-
-        # Get the callback
-        view = mock_discord_interaction.followup.send.call_args.kwargs["view"]
-        select_menu = view.children[0]
-        callback = select_menu.callback
-
-        # Create different user interaction
-        wrong_user_interaction = AsyncMock()
-        wrong_user_interaction.user.id = 999  # Different from original user (111)
-        wrong_user_interaction.response = AsyncMock()
-
-        # Execute callback with wrong user
-        await callback(wrong_user_interaction)
-
-        # Verify rejection
-        wrong_user_interaction.response.send_message.assert_called_once()
-        call_args = wrong_user_interaction.response.send_message.call_args
-        assert "not for you" in call_args[0][0].lower()
-        assert call_args.kwargs["ephemeral"] is True
-
-    @pytest.mark.asyncio
-    async def test_media_selection_callback_success(
-        self, mock_discord_bot, mock_discord_interaction, sample_movie
+    @pytest.mark.parametrize(
+        "user_id,expect_rejection", [(999, True), (111, False)], ids=["wrong_user", "same_user"]
+    )
+    async def test_media_selection_callback(
+        self,
+        movie_cog,
+        overseerr,
+        mock_discord_interaction,
+        sample_movie,
+        selection_callback,
+        user_id,
+        expect_rejection,
     ):
-        """Test media selection callback fetches and shows details"""
-        # Setup
-        cog = MovieCommands(mock_discord_bot)
-        mock_discord_bot.overseerr = AsyncMock()
-        mock_discord_bot.overseerr.get_media_by_id = AsyncMock(return_value=sample_movie)
-
-        await cog._show_media_selection(mock_discord_interaction, [sample_movie])
-
-        # Get the callback
-        view = mock_discord_interaction.followup.send.call_args.kwargs["view"]
-        select_menu = view.children[0]
-        callback = select_menu.callback
+        """Test media selection callback rejects other users and shows details otherwise"""
+        overseerr.get_media_by_id.return_value = sample_movie
 
-        # Create select interaction
-        select_interaction = AsyncMock()
-        select_interaction.user.id = 111  # Same as original user
-        select_interaction.response = AsyncMock()
+        select_interaction = _make_interaction(user_id)
         select_interaction.data = {"values": ["movie:550"]}
 
-        with patch.object(cog, "_show_media_details", new_callable=AsyncMock) as mock_show_details:
-            # Execute callback
-            await callback(select_interaction)
-
-            # Verify
+        with patch.object(
+            movie_cog, "_show_media_details", new_callable=AsyncMock
+        ) as mock_show_details:
+            await selection_callback(select_interaction)
+
+        if expect_rejection:
+            select_interaction.response.send_message.assert_called_once()
+            call_args = select_interaction.response.send_message.call_args
+            assert "not for you" in call_args[0][0].lower()
+            assert call_args.kwargs["ephemeral"] is True
+            overseerr.get_media_by_id.assert_not_called()
+            mock_show_details.assert_not_called()
+        else:
             select_interaction.response.defer.assert_called_once()
-            mock_discord_bot.overseerr.get_media_by_id.assert_called_once_with(550, "movie")
+            overseerr.get_media_by_id.assert_called_once_with(550, "movie")
             mock_show_details.assert_called_once_with(mock_discord_interaction, sample_movie)
 
 
-@pytest.mark.unit
 class TestShowMediaDetails:
     """Test _show_media_details method"""
 
-    @pytest.mark.asyncio
-    async def test_show_movie_details_available(self, mock_discord_bot, mock_discord_interaction):
-        """Test showing details for available movie"""
-        # Setup
-        cog = MovieCommands(mock_discord_bot)
-        movie = Movie(
-            tmdb_id=550,
-            title="Fight Club",
-            overview="A ticking-time-bomb insomniac...",
-            release_date="1999-10-15",
-            poster_path="/poster.jpg",
-            available=True,
-            requested=False,
-            status=MediaStatus.AVAILABLE,
-        )
-
-        # Execute
-        await cog._show_media_details(mock_discord_interaction, movie)
-
-        # Verify
-        call_args = mock_discord_interaction.edit_original_response.call_args
-        embed = call_args.kwargs["embed"]
-        assert "🎬" in embed.title
-        assert "Fight Club" in embed.title
-        assert embed.color == discord.Color.green()
-        assert "✅ Available" in str(embed.fields)
-        assert call_args.kwargs["view"] is None  # No request button for available
-
-    @pytest.mark.asyncio
-    async def test_show_movie_details_requested(self, mock_discord_bot, mock_discord_interaction):
-        """Test showing details for already requested movie"""
-        # Setup
-        cog = MovieCommands(mock_discord_bot)
-        movie = Movie(
-            tmdb_id=550,
-            title="Fight Club",
-            overview="A ticking-time-bomb insomniac...",
-            release_date="1999-10-15",
-            poster_path="/poster.jpg",
-            available=False,
-            requested=True,
-            status=MediaStatus.PENDING,
-        )
-
-        # Execute
-        await cog._show_media_details(mock_discord_interaction, movie)
-
-        # Verify
-        call_args = mock_discord_interaction.edit_original_response.call_args
-        embed = call_args.kwargs["embed"]
-        assert embed.color == discord.Color.orange()
-        assert "Already Requested" in str(embed.fields)
-        assert call_args.kwargs["view"] is None  # No request button
-
-    @pytest.mark.asyncio
-    async def test_show_movie_details_requestable(self, mock_discord_bot, mock_discord_interaction):
-        """Test showing details for requestable movie with button"""
-        # Setup
-        cog = MovieCommands(mock_discord_bot)
-        movie = Movie(
-            tmdb_id=550,
-            title="Fight Club",
-            overview="A ticking-time-bomb insomniac...",
-            release_date="1999-10-15",
-            poster_path="/poster.jpg",
-            available=False,
-            requested=False,
-            status=MediaStatus.UNKNOWN,
-        )
+    @pytest.mark.parametrize(
+        "media_fixture,expected_title,expected_color,expected_status,expected_button",
+        [
+            (
+                "movie_available",
+                "🎬 Fight Club",
+                GREEN,
+                "✅ Available",
+                None,  # No request button for available
+            ),
+            (
+                "movie_requested",
+                "🎬 Fight Club",
+                ORANGE,
+                "Already Requested",
+                None,  # No request button for already requested
+            ),
+            (
+                "movie_requestable",
+                "🎬 Fight Club",
+                BLUE,
+                None,
+                ("Request This Movie", "🎬"),
+            ),
+            (
+                "tv_requestable",
+                "📺 Breaking Bad",
+                BLUE,
+                None,
+                ("Request This Show", "📺"),
+            ),
+        ],
+        ids=["movie_available", "movie_requested", "movie_requestable", "tv_requestable"],
+    )
+    async def test_show_media_details(
+        self,
+        request,
+        movie_cog,
+        mock_discord_interaction,
+        media_fixture,
+        expected_title,
+        expected_color,
+        expected_status,
+        expected_button,
+    ):
+        """Test details embed colour, status and request button for each media state"""
+        media = request.getfixturevalue(media_fixture)
 
         # Execute
-        await cog._show_media_details(mock_discord_interaction, movie)
+        await movie_cog._show_media_details(mock_discord_interaction, media)
 
         # Verify
         call_args = mock_discord_interaction.edit_original_response.call_args
         embed = call_args.kwargs["embed"]
-        assert "🎬" in embed.title
-        assert "Fight Club" in embed.title
+        assert embed.title == expected_title
+        assert embed.color == expected_color
+        if expected_status:
+            assert expected_status in str(embed.fields)
 
         view = call_args.kwargs["view"]
-        assert isinstance(view, discord.ui.View)
+        if expected_button is None:
+            assert view is None
+        else:
+            assert isinstance(view, VIEW_CLS)
 
-        button = view.children[0]
-        assert isinstance(button, discord.ui.Button)
-        assert "Request This Movie" in button.label
-        assert button.emoji.name == "🎬"
-
-    @pytest.mark.asyncio
-    async def test_show_tv_details_requestable(self, mock_discord_bot, mock_discord_interaction):
-        """Test showing details for requestable TV show"""
-        # Setup
-        cog = MovieCommands(mock_discord_bot)
-        tv_show = TVShow(
-            tmdb_id=1396,
-            name="Breaking Bad",
-            overview="A high school chemistry teacher...",
-            first_air_date="2008-01-20",
-            poster_path="/poster.jpg",
-            available=False,
-            requested=False,
-            status=MediaStatus.UNKNOWN,
-        )
-
-        # Execute
-        await cog._show_media_details(mock_discord_interaction, tv_show)
-
-        # Verify
-        call_args = mock_discord_interaction.edit_original_response.call_args
-        embed = call_args.kwargs["embed"]
-        assert "📺" in embed.title
-        assert "Breaking Bad" in embed.title
-
-        view = call_args.kwargs["view"]
-        button = view.children[0]
-        assert "Request This Show" in button.label
-        assert button.emoji.name == "📺"
+            button = view.children[0]
+            assert isinstance(button, BUTTON_CLS)
+            assert button.label == expected_button[0]
+            assert button.emoji.name == expected_button[1]
 
 
-@pytest.mark.unit
 class TestRequestButtonCallback:
     """Test request button callback functionality"""
 
-    @pytest.mark.asyncio
-    async def test_request_button_wrong_user(self, mock_discord_bot, mock_discord_interaction):
+    async def test_request_button_wrong_user(
+        self, movie_cog, movie_requestable, mock_discord_interaction
+    ):
         """Test request button rejects wrong user"""
         # Setup
-        cog = MovieCommands(mock_discord_bot)
-        movie = Movie(
-            tmdb_id=550,
-            title="Fight Club",
-            overview="Test",
-            release_date="1999-10-15",
-            poster_path=None,
-            available=False,
-            requested=False,
-        )
-
-        await cog._show_media_details(mock_discord_interaction, movie)
+        await movie_cog._show_media_details(mock_discord_interaction, movie_requestable)
 
-        # Get the button callback
-        view = mock_discord_interaction.edit_original_response.call_args.kwargs["view"]
-        button = view.children[0]
-        callback = button.callback
+        callback = _button_callback_from(mock_discord_interaction)
 
-        # Create different user interaction
-        wrong_user_interaction = AsyncMock()
-        wrong_user_interaction.user.id = 999
-        wrong_user_interaction.response = AsyncMock()
+        wrong_user_interaction = _make_interaction(999)
 
         # Execute
         await callback(wrong_user_interaction)
@@ -594,47 +427,27 @@ class TestRequestButtonCallback:
         call_args = wrong_user_interaction.response.send_message.call_args
         assert "not for you" in call_args[0][0].lower()
 
-    @pytest.mark.asyncio
-    async def test_request_movie_success(self, mock_discord_bot, mock_discord_interaction):
+    async def test_request_movie_success(
+        self, movie_cog, overseerr, movie_requestable, mock_discord_bot, mock_discord_interaction
+    ):
         """Test successful movie request"""
         # Setup
-        cog = MovieCommands(mock_discord_bot)
-        mock_discord_bot.overseerr = AsyncMock()
-        mock_discord_bot.overseerr.request_movie = AsyncMock(
-            return_value=MovieRequestResult(success=True)
-        )
+        overseerr.request_movie.return_value = MovieRequestResult(success=True)
         mock_discord_bot.notifications = MagicMock()
         mock_discord_bot.notifications.add_request = MagicMock()
 
-        movie = Movie(
-            tmdb_id=550,
-            title="Fight Club",
-            overview="Test",
-            release_date="1999-10-15",
-            poster_path=None,
-            available=False,
-            requested=False,
-        )
-
-        await cog._show_media_details(mock_discord_interaction, movie)
+        await movie_cog._show_media_details(mock_discord_interaction, movie_requestable)
 
-        # Get the button callback
-        view = mock_discord_interaction.edit_original_response.call_args.kwargs["view"]
-        button = view.children[0]
-        callback = button.callback
+        callback = _button_callback_from(mock_discord_interaction)
 
-        # Create button click interaction
-        button_interaction = AsyncMock()
-        button_interaction.user.id = 111  # Same as original
-        button_interaction.user.name = "TestUser"
-        button_interaction.response = AsyncMock()
+        button_interaction = _make_interaction(111)
 
         # Execute
         await callback(button_interaction)
 
         # Verify
         button_interaction.response.defer.assert_called_once()
-        mock_discord_bot.overseerr.request_movie.assert_called_once_with(550)
+        overseerr.request_movie.assert_called_once_with(550)
 
         # Verify notification was added
         mock_discord_bot.notifications.add_request.assert_called_once_with(
@@ -651,80 +464,43 @@ class TestRequestButtonCallback:
         assert "✅" in embed.title
         assert "Request Submitted" in embed.title
         assert "Fight Club" in embed.description
-        assert embed.color == discord.Color.green()
+        assert embed.color == GREEN
 
-    @pytest.mark.asyncio
-    async def test_request_tv_success(self, mock_discord_bot, mock_discord_interaction):
+    async def test_request_tv_success(
+        self, movie_cog, overseerr, tv_requestable, mock_discord_bot, mock_discord_interaction
+    ):
         """Test successful TV show request"""
         # Setup
-        cog = MovieCommands(mock_discord_bot)
-        mock_discord_bot.overseerr = AsyncMock()
-        mock_discord_bot.overseerr.request_tv = AsyncMock(
-            return_value=MovieRequestResult(success=True)
-        )
+        overseerr.request_tv.return_value = MovieRequestResult(success=True)
         mock_discord_bot.notifications = MagicMock()
         mock_discord_bot.notifications.add_request = MagicMock()
 
-        tv_show = TVShow(
-            tmdb_id=1396,
-            name="Breaking Bad",
-            overview="Test",
-            first_air_date="2008-01-20",
-            poster_path=None,
-            available=False,
-            requested=False,
-        )
-
-        await cog._show_media_details(mock_discord_interaction, tv_show)
+        await movie_cog._show_media_details(mock_discord_interaction, tv_requestable)
 
-        # Get the button callback
-        view = mock_discord_interaction.edit_original_response.call_args.kwargs["view"]
-        button = view.children[0]
-        callback = button.callback
+        callback = _button_callback_from(mock_discord_interaction)
 
-        # Create button click interaction
-        button_interaction = AsyncMock()
-        button_interaction.user.id = 111
-        button_interaction.user.name = "TestUser"
-        button_interaction.response = AsyncMock()
+        button_interaction = _make_interaction(111)
 
         # Execute
         await callback(button_interaction)
 
         # Verify TV request was called
-        mock_discord_bot.overseerr.request_tv.assert_called_once_with(1396)
+        overseerr.request_tv.assert_called_once_with(1396)
 
-    @pytest.mark.asyncio
-    async def test_request_movie_failure(self, mock_discord_bot, mock_discord_interaction):
+    async def test_request_movie_failure(
+        self, movie_cog, overseerr, movie_requestable, mock_discord_interaction
+    ):
         """Test failed movie request"""
         # Setup
-        cog = MovieCommands(mock_discord_bot)
-        mock_discord_bot.overseerr = AsyncMock()
-        mock_discord_bot.overseerr.request_movie = AsyncMock(
-            return_value=MovieRequestResult(success=False, error_message="Quota exceeded")
+        overseerr.request_movie.return_value = MovieRequestResult(
+            success=False, error_message="Quota exceeded"
         )
 
-        movie = Movie(
-            tmdb_id=550,
-            title="Fight Club",
-            overview="Test",
-            release_date="1999-10-15",
-            poster_path=None,
-            available=False,
-            requested=False,
-        )
-
-        await cog._show_media_details(mock_discord_interaction, movie)
+        await movie_cog._show_media_details(mock_discord_interaction, movie_requestable)
 
-        # Get the button callback
-        view = mock_discord_interaction.edit_original_response.call_args.kwargs["view"]
-        button = view.children[0]
-        callback = button.callback
+        callback = _button_callback_from(mock_discord_interaction)
 
-        # Create button click interaction
-        button_interaction = AsyncMock()
-        button_interaction.user.id = 111
-        button_interaction.response = AsyncMock()
+        button_interaction = _make_interaction(111)
 
         # Execute
         await callback(button_interaction)
@@ -735,93 +511,50 @@ class TestRequestButtonCallback:
         assert "❌" in embed.title
         assert "Request Failed" in embed.title
         assert "Quota exceeded" in embed.description
-        assert embed.color == discord.Color.red()
+        assert embed.color == RED
 
-    @pytest.mark.asyncio
     async def test_request_without_notification_manager(
-        self, mock_discord_bot, mock_discord_interaction
+        self, movie_cog, overseerr, movie_requestable, mock_discord_bot, mock_discord_interaction
     ):
         """Test request works without notification manager"""
         # Setup
-        cog = MovieCommands(mock_discord_bot)
-        mock_discord_bot.overseerr = AsyncMock()
-        mock_discord_bot.overseerr.request_movie = AsyncMock(
-            return_value=MovieRequestResult(success=True)
-        )
+        overseerr.request_movie.return_value = MovieRequestResult(success=True)
         mock_discord_bot.notifications = None  # No notification manager
 
-        movie = Movie(
-            tmdb_id=550,
-            title="Fight Club",
-            overview="Test",
-            release_date="1999-10-15",
-            poster_path=None,
-            available=False,
-            requested=False,
-        )
-
-        await cog._show_media_details(mock_discord_interaction, movie)
+        await movie_cog._show_media_details(mock_discord_interaction, movie_requestable)
 
-        # Get the button callback
-        view = mock_discord_interaction.edit_original_response.call_args.kwargs["view"]
-        button = view.children[0]
-        callback = button.callback
+        callback = _button_callback_from(mock_discord_interaction)
 
-        # Create button click interaction
-        button_interaction = AsyncMock()
-        button_interaction.user.id = 111
-        button_interaction.user.name = "TestUser"
-        button_interaction.response = AsyncMock()
+        button_interaction = _make_interaction(111)
 
         # Execute - should not raise error
         await callback(button_interaction)
 
         # Verify request still succeeded
-        mock_discord_bot.overseerr.request_movie.assert_called_once_with(550)
+        overseerr.request_movie.assert_called_once_with(550)
 
 
-@pytest.mark.unit
 class TestFormatMediaTitle:
     """Test _format_media_title helper method"""
 
-    def test_format_title_with_year(self, mock_discord_bot):
+    def test_format_title_with_year(self, movie_cog, movie_requestable):
         """Test formatting title with release year"""
-        cog = MovieCommands(mock_discord_bot)
-        movie = Movie(
-            tmdb_id=550,
-            title="Fight Club",
-            overview="Test",
-            release_date="1999-10-15",
-            poster_path=None,
-        )
-
-        result = cog._format_media_title(movie)
+        result = movie_cog._format_media_title(movie_requestable)
         assert result == "Fight Club (1999)"
 
-    def test_format_title_without_year(self, mock_discord_bot):
+    def test_format_title_without_year(self, movie_cog, movie_requestable):
         """Test formatting title without release year"""
-        cog = MovieCommands(mock_discord_bot)
-        movie = Movie(
-            tmdb_id=550,
-            title="Fight Club",
-            overview="Test",
-            release_date="",
-            poster_path=None,
-        )
+        movie = dataclasses.replace(movie_requestable, release_date="")
 
-        result = cog._format_media_title(movie)
+        result = movie_cog._format_media_title(movie)
         assert result == "Fight Club"
 
 
-@pytest.mark.unit
 class TestCogSetup:
     """Test cog setup function"""
 
-    @pytest.mark.asyncio
     async def test_setup_function(self, mock_discord_bot):
         """Test the setup function adds cog to bot"""
-        from bot.cogs.movie_commands import setup
-
         mock_discord_bot.add_cog = AsyncMock()
 
         await setup(mock_discord_bot)
@@ -1,57 +1,54 @@
 """Unit tests for notification manager"""
 
+import asyncio
+import contextlib
 import json
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from bot.notifications import NotificationManager, PendingRequest
+from bot.notifications import (
+    JOURNAL_COMPACT_MIN_ENTRIES,
+    MAX_CONCURRENT_LOOKUPS,
+    NotificationManager,
+    PendingRequest,
+)
 from bot.overseerr import MediaStatus
 
+PENDING = MediaStatus.PENDING
+
+THIRTY_MINUTES = timedelta(minutes=30)
+THREE_HOURS = timedelta(hours=3)
+TWO_DAYS = timedelta(days=2)
+ONE_HOUR_ONE_MINUTE = timedelta(hours=1, minutes=1)
+
 
 @pytest.mark.unit
 class TestPendingRequest:
     """Test PendingRequest model"""
 
-    def test_pending_request_creation(self):
+    def test_pending_request_creation(self, sample_pending_request):
         """Test creating a PendingRequest"""
-        request = PendingRequest(
-            user_id=111,
-            username="TestUser",
-            tmdb_id=550,
-            title="Fight Club",
-            timestamp="2026-02-01T12:00:00",
-            is_4k=False,
-            last_status=MediaStatus.PENDING,
-        )
+        request = sample_pending_request
 
         assert request.user_id == 111
         assert request.username == "TestUser"
         assert request.tmdb_id == 550
         assert request.title == "Fight Club"
         assert request.is_4k is False
-        assert request.last_status == MediaStatus.PENDING
+        assert request.last_status is PENDING
 
-    def test_pending_request_to_dict(self):
+    def test_pending_request_to_dict(self, sample_pending_request):
         """Test converting PendingRequest to dictionary"""
-        request = PendingRequest(
-            user_id=111,
-            username="TestUser",
-            tmdb_id=550,
-            title="Fight Club",
-            timestamp="2026-02-01T12:00:00",
-            is_4k=False,
-            last_status=MediaStatus.PENDING,
-        )
-
-        data = request.to_dict()
+        data = sample_pending_request.to_dict()
 
         assert data["user_id"] == 111
         assert data["username"] == "TestUser"
         assert data["tmdb_id"] == 550
         assert data["title"] == "Fight Club"
+        assert data["timestamp"] == int(datetime(2026, 2, 1, 12).timestamp())
         assert data["is_4k"] is False
         assert data["last_status"] == 2
 
@@ -73,8 +70,9 @@ class TestPendingRequest:
         assert request.username == "TestUser"
         assert request.tmdb_id == 550
         assert request.title == "Fight Club"
+        assert request.timestamp == int(datetime(2026, 2, 1, 12).timestamp())
         assert request.is_4k is False
-        assert request.last_status == MediaStatus.PENDING
+        assert request.last_status is PENDING
 
     def test_pending_request_4k(self):
         """Test creating a 4K pending request"""
@@ -85,47 +83,25 @@ class TestPendingRequest:
             title="Fight Club",
             timestamp="2026-02-01T12:00:00",
             is_4k=True,
-            last_status=MediaStatus.PENDING,
+            last_status=PENDING,
         )
 
         assert request.is_4k is True
 
-    def test_get_elapsed_time_minutes(self):
-        """Test elapsed time in minutes"""
-        # 30 minutes ago
-        timestamp = (datetime.now() - timedelta(minutes=30)).isoformat()
-        request = PendingRequest(
-            user_id=111,
-            username="TestUser",
-            tmdb_id=550,
-            title="Fight Club",
-            timestamp=timestamp,
-            is_4k=False,
-        )
-
-        elapsed = request.get_elapsed_time()
-        assert "minute" in elapsed
-
-    def test_get_elapsed_time_hours(self):
-        """Test elapsed time in hours"""
-        # 3 hours ago
-        timestamp = (datetime.now() - timedelta(hours=3)).isoformat()
-        request = PendingRequest(
-            user_id=111,
-            username="TestUser",
-            tmdb_id=550,
-            title="Fight Club",
-            timestamp=timestamp,
-            is_4k=False,
-        )
-
-        elapsed = request.get_elapsed_time()
-        assert "hour" in elapsed
-
-    def test_get_elapsed_time_days(self):
-        """Test elapsed time in days"""
-        # 2 days ago
-        timestamp = (datetime.now() - timedelta(days=2)).isoformat()
+    @pytest.mark.parametrize(
+        "delta,expect",
+        [
+            (THIRTY_MINUTES, "minute"),
+            (THREE_HOURS, "hour"),
+            (TWO_DAYS, "day"),
+            # Should use singular 'hour' not 'hours'
+            (ONE_HOUR_ONE_MINUTE, "1 hour"),
+        ],
+        ids=["minutes", "hours", "days", "singular"],
+    )
+    def test_get_elapsed_time(self, delta, expect):
+        """Test elapsed time is reported in the largest whole unit"""
+        timestamp = int(time.time() - delta.total_seconds())
         request = PendingRequest(
             user_id=111,
             username="TestUser",
@@ -135,50 +111,26 @@ class TestPendingRequest:
             is_4k=False,
         )
 
-        elapsed = request.get_elapsed_time()
-        assert "day" in elapsed
-
-    def test_get_elapsed_time_singular(self):
-        """Test elapsed time with singular units"""
-        # 1 hour and 1 minute ago
-        timestamp = (datetime.now() - timedelta(hours=1, minutes=1)).isoformat()
-        request = PendingRequest(
-            user_id=111,
-            username="TestUser",
-            tmdb_id=550,
-            title="Fight Club",
-            timestamp=timestamp,
-            is_4k=False,
-        )
-
-        elapsed = request.get_elapsed_time()
-        # Should use singular 'hour' not 'hours'
-        assert "1 hour" in elapsed
+        assert expect in request.get_elapsed_time()
 
 
 @pytest.mark.unit
 class TestNotificationManager:
     """Test NotificationManager"""
 
-    def test_notification_manager_creation(self, mock_discord_bot, temp_config_dir):
+    def test_notification_manager_creation(
+        self, mock_discord_bot, temp_config_dir, notification_manager
+    ):
         """Test creating a NotificationManager"""
-        notifications_file = temp_config_dir / "notifications.json"
-        manager = NotificationManager(
-            bot=mock_discord_bot,
-            notifications_file=str(notifications_file),
-        )
+        manager = notification_manager
 
         assert manager.bot == mock_discord_bot
-        assert manager.notifications_file == notifications_file
+        assert manager.notifications_file == temp_config_dir / "notifications.json"
         assert manager.pending_requests == {}
 
-    def test_load_notifications_empty(self, mock_discord_bot, temp_config_dir):
+    def test_load_notifications_empty(self, notification_manager):
         """Test loading notifications when file doesn't exist"""
-        notifications_file = temp_config_dir / "notifications.json"
-        manager = NotificationManager(
-            bot=mock_discord_bot,
-            notifications_file=str(notifications_file),
-        )
+        manager = notification_manager
 
         assert manager.pending_requests == {}
 
@@ -190,9 +142,9 @@ class TestNotificationManager:
         )
 
         assert len(manager.pending_requests) == 1
-        assert "111:550" in manager.pending_requests
+        assert (111, 550, False) in manager.pending_requests
 
-        request = manager.pending_requests["111:550"]
+        request = manager.pending_requests[(111, 550, False)]
         assert request.user_id == 111
         assert request.tmdb_id == 550
         assert request.title == "Fight Club"
@@ -213,13 +165,10 @@ class TestNotificationManager:
         # Should gracefully handle error and return empty dict
         assert manager.pending_requests == {}
 
-    def test_save_notifications(self, mock_discord_bot, temp_config_dir):
+    def test_save_notifications(self, notification_manager):
         """Test saving notifications to file"""
-        notifications_file = temp_config_dir / "notifications.json"
-        manager = NotificationManager(
-            bot=mock_discord_bot,
-            notifications_file=str(notifications_file),
-        )
+        manager = notification_manager
+        notifications_file = manager.notifications_file
 
         # Add a request
         manager.add_request(
@@ -233,102 +182,157 @@ class TestNotificationManager:
         # File should be created
         assert notifications_file.exists()
 
-        # Read and verify file content
-        with open(notifications_file, "r") as f:
-            data = json.load(f)
+        # Read and verify file content: one journal entry per line
+        entries = [json.loads(line) for line in notifications_file.read_text().splitlines()]
 
-        assert "111:550" in data
-        assert data["111:550"]["user_id"] == 111
-        assert data["111:550"]["tmdb_id"] == 550
+        assert len(entries) == 1
+        assert entries[0]["op"] == "add"
+        assert entries[0]["k"] == [111, 550, False]
+        assert entries[0]["v"]["user_id"] == 111
+        assert entries[0]["v"]["tmdb_id"] == 550
 
-    def test_add_request(self, mock_discord_bot, temp_config_dir):
-        """Test adding a request for tracking"""
+    def test_load_notifications_replays_journal(self, mock_discord_bot, temp_config_dir):
+        """Test later journal entries override and remove earlier ones"""
         notifications_file = temp_config_dir / "notifications.json"
+        first = PendingRequest(111, "User1", 550, "Fight Club", "2026-02-01T12:00:00")
+        second = PendingRequest(222, "User2", 550, "Fight Club", "2026-02-01T12:00:00")
+        entries = [
+            {"op": "add", "k": [111, 550, False], "v": first.to_dict()},
+            {"op": "add", "k": [222, 550, False], "v": second.to_dict()},
+            # Keys journaled in the older "user:tmdb" string form are still understood
+            {"op": "remove", "k": "111:550"},
+        ]
+        notifications_file.write_text("".join(json.dumps(entry) + "\n" for entry in entries))
+
         manager = NotificationManager(
             bot=mock_discord_bot,
             notifications_file=str(notifications_file),
         )
 
-        manager.add_request(
-            user_id=111,
-            username="TestUser",
-            tmdb_id=550,
-            title="Fight Club",
-            is_4k=False,
-        )
-
-        assert len(manager.pending_requests) == 1
-        assert "111:550" in manager.pending_requests
-
-        request = manager.pending_requests["111:550"]
-        assert request.user_id == 111
-        assert request.username == "TestUser"
-        assert request.tmdb_id == 550
-        assert request.title == "Fight Club"
-        assert request.is_4k is False
+        assert list(manager.pending_requests) == [(222, 550, False)]
+        assert manager.pending_requests[(222, 550, False)].username == "User2"
 
-    def test_add_request_4k(self, mock_discord_bot, temp_config_dir):
-        """Test adding a 4K request"""
+    def test_torn_journal_rewritten_before_append(self, mock_discord_bot, temp_config_dir):
+        """Test an append after a crash mid-write is not glued onto the torn line"""
         notifications_file = temp_config_dir / "notifications.json"
+        first = PendingRequest(111, "User1", 550, "Fight Club", "2026-02-01T12:00:00")
+        entry = {"op": "add", "k": [111, 550, False], "v": first.to_dict()}
+        notifications_file.write_text(json.dumps(entry) + "\n" + '{"op": "add", "k": [2')
+
         manager = NotificationManager(
             bot=mock_discord_bot,
             notifications_file=str(notifications_file),
         )
+        assert list(manager.pending_requests) == [(111, 550, False)]
 
-        manager.add_request(
-            user_id=111,
-            username="TestUser",
-            tmdb_id=550,
-            title="Fight Club",
-            is_4k=True,
-        )
+        manager.add_request(222, "User2", 603, "The Matrix", False)
+        # Completed requests are dropped the way _check_and_notify does it
+        del manager.pending_requests[(111, 550, False)]
+        manager._append("remove", (111, 550, False))
 
-        # 4K requests have different key
-        assert "111:550_4k" in manager.pending_requests
+        reloaded = NotificationManager(mock_discord_bot, str(notifications_file))
+        assert list(reloaded.pending_requests) == [(222, 603, False)]
+        assert notifications_file.read_bytes().endswith(b"\n")
 
-    def test_add_request_duplicate(self, mock_discord_bot, temp_config_dir):
-        """Test adding duplicate request doesn't create duplicates"""
+    def test_malformed_journal_entries_skipped(self, mock_discord_bot, temp_config_dir):
+        """Test valid-JSON entries with the wrong shape are skipped instead of dropping the file"""
         notifications_file = temp_config_dir / "notifications.json"
+        first = PendingRequest(111, "User1", 550, "Fight Club", "2026-02-01T12:00:00")
+        second = PendingRequest(222, "User2", 603, "The Matrix", "2026-02-01T12:00:00")
+        lines = [
+            {"op": "add", "k": [111, 550, False], "v": first.to_dict()},
+            1,
+            {"op": "add", "k": [333, 680, False]},
+            {"op": "rename", "k": [111, 550, False]},
+            {"op": "add", "k": [222, 603, False], "v": second.to_dict()},
+        ]
+        notifications_file.write_text("".join(json.dumps(line) + "\n" for line in lines))
+
         manager = NotificationManager(
             bot=mock_discord_bot,
             notifications_file=str(notifications_file),
         )
-
-        # Add same request twice
-        manager.add_request(
-            user_id=111,
-            username="TestUser",
-            tmdb_id=550,
-            title="Fight Club",
-            is_4k=False,
-        )
-        manager.add_request(
-            user_id=111,
-            username="TestUser",
-            tmdb_id=550,
-            title="Fight Club",
-            is_4k=False,
-        )
-
-        # Should only have one request
-        assert len(manager.pending_requests) == 1
-
-    def test_add_request_different_users(self, mock_discord_bot, temp_config_dir):
-        """Test adding requests from different users for same movie"""
+        assert list(manager.pending_requests) == [(111, 550, False), (222, 603, False)]
+
+        manager.add_request(333, "User3", 680, "Pulp Fiction", False)
+
+        entries = [json.loads(line) for line in notifications_file.read_text().splitlines()]
+        assert all(isinstance(entry, dict) and "v" in entry for entry in entries)
+        reloaded = NotificationManager(mock_discord_bot, str(notifications_file))
+        assert list(reloaded.pending_requests) == [
+            (111, 550, False),
+            (222, 603, False),
+            (333, 680, False),
+        ]
+
+    def test_legacy_file_rewritten_as_journal(
+        self, mock_discord_bot, temp_config_dir, mock_notification_file
+    ):
+        """Test a pre-journal notifications file is converted on the first save"""
         notifications_file = temp_config_dir / "notifications.json"
+        notifications_file.write_bytes(mock_notification_file.read_bytes())
         manager = NotificationManager(
             bot=mock_discord_bot,
             notifications_file=str(notifications_file),
         )
 
-        # Add requests from two different users for same movie
-        manager.add_request(111, "User1", 550, "Fight Club", False)
         manager.add_request(222, "User2", 550, "Fight Club", False)
 
-        # Should have two separate requests
-        assert len(manager.pending_requests) == 2
-        assert "111:550" in manager.pending_requests
-        assert "222:550" in manager.pending_requests
+        entries = [json.loads(line) for line in notifications_file.read_text().splitlines()]
+        assert [(entry["op"], entry["k"]) for entry in entries] == [
+            ("add", [111, 550, False]),
+            ("add", [222, 550, False]),
+        ]
+
+    def test_journal_compaction(self, notification_manager):
+        """Test the journal is rewritten once it holds many stale entries"""
+        manager = notification_manager
+        manager.add_request(111, "TestUser", 550, "Fight Club", False)
+        request = manager.pending_requests[(111, 550, False)]
+
+        for _ in range(JOURNAL_COMPACT_MIN_ENTRIES):
+            manager._append("add", (111, 550, False), request)
+
+        lines = manager.notifications_file.read_text().splitlines()
+        assert len(lines) < JOURNAL_COMPACT_MIN_ENTRIES
+        reloaded = NotificationManager(manager.bot, str(manager.notifications_file))
+        assert list(reloaded.pending_requests) == [(111, 550, False)]
+
+    @pytest.mark.no_save
+    @pytest.mark.parametrize(
+        "calls,expected_keys",
+        [
+            ([(111, "TestUser", 550, "Fight Club", False)], {(111, 550, False)}),
+            # 4K requests have a different key
+            ([(111, "TestUser", 550, "Fight Club", True)], {(111, 550, True)}),
+            # Adding the same request twice tracks it once
+            ([(111, "TestUser", 550, "Fight Club", False)] * 2, {(111, 550, False)}),
+            # Different users requesting the same movie are tracked separately
+            (
+                [
+                    (111, "User1", 550, "Fight Club", False),
+                    (222, "User2", 550, "Fight Club", False),
+                ],
+                {(111, 550, False), (222, 550, False)},
+            ),
+        ],
+        ids=["single", "4k", "duplicate", "different_users"],
+    )
+    def test_add_request(self, notification_manager, calls, expected_keys):
+        """Test adding requests for tracking"""
+        manager = notification_manager
+
+        for call in calls:
+            manager.add_request(*call)
+
+        assert set(manager.pending_requests) == expected_keys
+        for user_id, username, tmdb_id, title, is_4k in calls:
+            request = manager.pending_requests[(user_id, tmdb_id, is_4k)]
+            assert request.user_id == user_id
+            assert request.username == username
+            assert request.tmdb_id == tmdb_id
+            assert request.title == title
+            assert request.is_4k is is_4k
 
     def test_notification_check_interval(self, mock_discord_bot, temp_config_dir):
         """Test that notification check interval is configured from settings"""
@@ -343,27 +347,10 @@ class TestNotificationManager:
         # Verify interval was set (task should exist)
         assert manager.check_availability is not None
 
-    @pytest.mark.asyncio
-    async def test_check_availability_task(self, mock_discord_bot, temp_config_dir, sample_movie):
+    async def test_check_availability_task(self, notification_bot, notification_manager):
         """Test the availability checking background task"""
-        notifications_file = temp_config_dir / "notifications.json"
-
-        # Mock overseerr client
-        mock_overseerr = AsyncMock()
-        mock_overseerr.get_movie_by_id = AsyncMock(return_value=sample_movie)
-        mock_discord_bot.overseerr = mock_overseerr
-
-        # Mock fetch_user method (async)
-        mock_user = MagicMock()
-        mock_user.id = 111
-        mock_user.name = "TestUser"
-        mock_user.send = AsyncMock()
-        mock_discord_bot.fetch_user = AsyncMock(return_value=mock_user)
-
-        manager = NotificationManager(
-            bot=mock_discord_bot,
-            notifications_file=str(notifications_file),
-        )
+        bot, mock_user = notification_bot
+        manager = notification_manager
 
         # Add a pending request with PENDING status
         request = PendingRequest(
@@ -371,44 +358,122 @@ class TestNotificationManager:
             username="TestUser",
             tmdb_id=550,
             title="Fight Club",
-            timestamp=datetime.now().isoformat(),
+            timestamp=int(time.time()),
+            is_4k=False,
+            last_status=PENDING,
+        )
+        manager.pending_requests[(111, 550, False)] = request
+        # A second user waiting on the same movie
+        manager.pending_requests[(222, 550, False)] = PendingRequest(
+            user_id=222,
+            username="OtherUser",
+            tmdb_id=550,
+            title="Fight Club",
+            timestamp=int(time.time()),
             is_4k=False,
-            last_status=MediaStatus.PENDING,
+            last_status=PENDING,
         )
-        manager.pending_requests["111:550"] = request
 
-        # Set movie to available
-        sample_movie.status = MediaStatus.AVAILABLE
-        sample_movie.available = True
+        # sample_movie (returned by get_movie_by_id) is already available
 
         # Run the check manually
-        await manager._check_and_notify()
+        completed = await manager._check_and_notify()
 
-        # User should have been notified
-        assert mock_user.send.called
+        # Overseerr is asked about the movie once, however many users requested it
+        bot.overseerr.get_movie_by_id.assert_awaited_once_with(550, is_4k=False)
 
-        # Request should be removed from pending
-        assert "111:550" not in manager.pending_requests
+        # Both users should have been notified
+        assert mock_user.send.await_count == 2
 
-    @pytest.mark.asyncio
-    async def test_start_stop_monitoring(self, mock_discord_bot, temp_config_dir):
-        """Test starting and stopping the monitoring task"""
-        notifications_file = temp_config_dir / "notifications.json"
-        manager = NotificationManager(
-            bot=mock_discord_bot,
-            notifications_file=str(notifications_file),
+        # Requests should be removed from pending
+        assert completed == 2
+        assert manager.pending_requests == {}
+
+    async def test_check_availability_lookup_error(self, notification_bot, notification_manager):
+        """Test a failed Overseerr lookup leaves the request pending"""
+        bot, mock_user = notification_bot
+        bot.overseerr.get_movie_by_id.side_effect = RuntimeError("Overseerr down")
+        manager = notification_manager
+        manager.pending_requests[(111, 550, False)] = PendingRequest(
+            user_id=111,
+            username="TestUser",
+            tmdb_id=550,
+            title="Fight Club",
+            timestamp=int(time.time()),
+        )
+
+        completed = await manager._check_and_notify()
+
+        assert completed == 0
+        assert (111, 550, False) in manager.pending_requests
+        mock_user.send.assert_not_called()
+
+    async def test_check_availability_lookup_cancelled(
+        self, notification_bot, notification_manager
+    ):
+        """Test a cancelled Overseerr lookup cancels the check instead of counting as a failure"""
+        bot, mock_user = notification_bot
+        bot.overseerr.get_movie_by_id.side_effect = asyncio.CancelledError()
+        manager = notification_manager
+        manager.pending_requests[(111, 550, False)] = PendingRequest(
+            user_id=111,
+            username="TestUser",
+            tmdb_id=550,
+            title="Fight Club",
+            timestamp=int(time.time()),
         )
 
+        with pytest.raises(asyncio.CancelledError):
+            await manager._check_and_notify()
+
+        assert (111, 550, False) in manager.pending_requests
+        mock_user.send.assert_not_called()
+
+    async def test_check_availability_caps_concurrent_lookups(
+        self, notification_bot, notification_manager, sample_tv_show
+    ):
+        """Test Overseerr lookups run at most MAX_CONCURRENT_LOOKUPS at a time"""
+        bot, _ = notification_bot
+        in_flight = peak = 0
+
+        async def get_movie_by_id(tmdb_id, is_4k=False):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return sample_tv_show  # still pending, so nothing is sent or removed
+
+        bot.overseerr.get_movie_by_id.side_effect = get_movie_by_id
+        manager = notification_manager
+        for tmdb_id in range(MAX_CONCURRENT_LOOKUPS * 3):
+            manager.pending_requests[(111, tmdb_id, False)] = PendingRequest(
+                user_id=111,
+                username="TestUser",
+                tmdb_id=tmdb_id,
+                title=f"Movie {tmdb_id}",
+                timestamp=int(time.time()),
+                last_status=PENDING,
+            )
+
+        await manager._check_and_notify()
+
+        assert bot.overseerr.get_movie_by_id.await_count == MAX_CONCURRENT_LOOKUPS * 3
+        assert peak == MAX_CONCURRENT_LOOKUPS
+
+    async def test_start_stop_monitoring(self, notification_manager):
+        """Test starting and stopping the monitoring task"""
+        manager = notification_manager
+
         # Start monitoring
         manager.start_monitoring()
         assert manager.check_availability.is_running()
 
-        # Stop monitoring
+        # Stop monitoring and wait for the cancelled task to finish
+        task = manager.check_availability.get_task()
         manager.stop_monitoring()
-        # Give it a moment to stop
-        import asyncio
-
-        await asyncio.sleep(0.1)
+        with contextlib.suppress(asyncio.CancelledError):
+            await asyncio.wait_for(task, timeout=1.0)
         assert not manager.check_availability.is_running()
 
     def test_save_creates_directory(self, mock_discord_bot, temp_config_dir):
@@ -1,28 +1,39 @@
 """Unit tests for Overseerr API client"""
 
 import pytest
-from aioresponses import aioresponses
+from yarl import URL
 
 from bot.overseerr import (
+    OverseerrAuthError,
     OverseerrClient,
+    OverseerrNotFoundError,
+    OverseerrResponseError,
     Movie,
     TVShow,
     MediaStatus,
     MovieRequestResult,
 )
 
+EMPTY_SEARCH = {"page": 1, "totalPages": 1, "totalResults": 0, "results": []}
+
 
 @pytest.mark.unit
 class TestMediaStatus:
     """Test MediaStatus enum"""
 
-    def test_media_status_values(self):
+    @pytest.mark.parametrize(
+        "name,value",
+        [
+            ("UNKNOWN", 1),
+            ("PENDING", 2),
+            ("PROCESSING", 3),
+            ("PARTIALLY_AVAILABLE", 4),
+            ("AVAILABLE", 5),
+        ],
+    )
+    def test_media_status_values(self, name, value):
         """Test MediaStatus enum values"""
-        assert MediaStatus.UNKNOWN == 1
-        assert MediaStatus.PENDING == 2
-        assert MediaStatus.PROCESSING == 3
-        assert MediaStatus.PARTIALLY_AVAILABLE == 4
-        assert MediaStatus.AVAILABLE == 5
+        assert MediaStatus[name].value == value
 
     def test_media_status_from_int(self):
         """Test creating MediaStatus from int"""
@@ -34,72 +45,52 @@ class TestMediaStatus:
 class TestMovie:
     """Test Movie data model"""
 
-    def test_movie_creation(self, sample_movie):
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("tmdb_id", 550),
+            ("title", "Fight Club"),
+            ("release_date", "1999-10-15"),
+            ("available", True),
+            ("requested", False),
+            ("status", MediaStatus.AVAILABLE),
+        ],
+    )
+    def test_movie_creation(self, sample_movie, attr, expected):
         """Test creating a Movie instance"""
-        assert sample_movie.tmdb_id == 550
-        assert sample_movie.title == "Fight Club"
-        assert sample_movie.release_date == "1999-10-15"
-        assert sample_movie.available is True
-        assert sample_movie.requested is False
-        assert sample_movie.status == MediaStatus.AVAILABLE
+        assert getattr(sample_movie, attr) == expected
 
     def test_poster_url(self, sample_movie):
         """Test poster URL generation"""
         expected_url = "https://image.tmdb.org/t/p/w500/pB8BM7pdSp6B6Ih7QZ4DrQ3PmJK.jpg"
         assert sample_movie.poster_url == expected_url
 
-    def test_poster_url_none(self):
+    def test_poster_url_none(self, movie_factory):
         """Test poster URL when poster_path is None"""
-        movie = Movie(
-            tmdb_id=1,
-            title="Test",
-            overview="Test",
-            release_date="2024-01-01",
-            poster_path=None,
-        )
+        movie = movie_factory(poster_path=None)
         assert movie.poster_url == ""
 
     def test_release_year(self, sample_movie):
         """Test release year extraction"""
         assert sample_movie.release_year == "1999"
 
-    def test_release_year_no_date(self):
+    def test_release_year_no_date(self, movie_factory):
         """Test release year when date is not set"""
-        movie = Movie(
-            tmdb_id=1,
-            title="Test",
-            overview="Test",
-            release_date="",
-            poster_path=None,
-        )
+        movie = movie_factory(release_date="")
         assert movie.release_year is None
 
     def test_cast_list(self, sample_movie):
         """Test cast list formatting"""
         assert sample_movie.cast_list == "Brad Pitt, Edward Norton, Helena Bonham Carter"
 
-    def test_cast_list_empty(self):
+    def test_cast_list_empty(self, movie_factory):
         """Test cast list when empty"""
-        movie = Movie(
-            tmdb_id=1,
-            title="Test",
-            overview="Test",
-            release_date="2024-01-01",
-            poster_path=None,
-            cast=[],
-        )
+        movie = movie_factory(cast=[])
         assert movie.cast_list == ""
 
-    def test_cast_list_truncation(self):
+    def test_cast_list_truncation(self, movie_factory):
         """Test cast list truncates to first 3 actors"""
-        movie = Movie(
-            tmdb_id=1,
-            title="Test",
-            overview="Test",
-            release_date="2024-01-01",
-            poster_path=None,
-            cast=["Actor 1", "Actor 2", "Actor 3", "Actor 4", "Actor 5"],
-        )
+        movie = movie_factory(cast=["Actor 1", "Actor 2", "Actor 3", "Actor 4", "Actor 5"])
         assert movie.cast_list == "Actor 1, Actor 2, Actor 3"
 
 
@@ -107,14 +98,20 @@ class TestMovie:
 class TestTVShow:
     """Test TVShow data model"""
 
-    def test_tv_show_creation(self, sample_tv_show):
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("tmdb_id", 1396),
+            ("name", "Breaking Bad"),
+            ("first_air_date", "2008-01-20"),
+            ("available", False),
+            ("requested", True),
+            ("status", MediaStatus.PENDING),
+        ],
+    )
+    def test_tv_show_creation(self, sample_tv_show, attr, expected):
         """Test creating a TVShow instance"""
-        assert sample_tv_show.tmdb_id == 1396
-        assert sample_tv_show.name == "Breaking Bad"
-        assert sample_tv_show.first_air_date == "2008-01-20"
-        assert sample_tv_show.available is False
-        assert sample_tv_show.requested is True
-        assert sample_tv_show.status == MediaStatus.PENDING
+        assert getattr(sample_tv_show, attr) == expected
 
     def test_title_alias(self, sample_tv_show):
         """Test title property alias"""
@@ -186,227 +183,157 @@ class TestOverseerrClient:
         )
         assert client.base_url == "https://overseerr.example.com:443/api/v1/"
 
-    @pytest.mark.asyncio
-    async def test_test_connection_success(self, overseerr_client):
-        """Test successful connection test"""
-        with aioresponses() as m:
-            m.get(
-                f"{overseerr_client.base_url}settings/main",
-                status=200,
-                payload={"apiKey": "test_key", "applicationUrl": "http://test"},
-            )
-
-            result = await overseerr_client.test_connection()
-            assert result is True
-
-    @pytest.mark.asyncio
-    async def test_test_connection_invalid_api_key(self, overseerr_client):
-        """Test connection with invalid API key"""
-        with aioresponses() as m:
-            m.get(
-                f"{overseerr_client.base_url}settings/main",
-                status=401,
-            )
-
-            with pytest.raises(Exception, match="Invalid API key"):
-                await overseerr_client.test_connection()
-
-    @pytest.mark.asyncio
-    async def test_test_connection_not_found(self, overseerr_client):
-        """Test connection with invalid hostname/port"""
-        with aioresponses() as m:
-            m.get(
-                f"{overseerr_client.base_url}settings/main",
-                status=404,
-            )
-
-            with pytest.raises(Exception, match="Invalid hostname/port"):
-                await overseerr_client.test_connection()
+    @pytest.mark.parametrize(
+        "status,payload,expected",
+        [
+            (200, {"apiKey": "test_key", "applicationUrl": "http://test"}, None),
+            (401, None, OverseerrAuthError),
+            (404, None, OverseerrNotFoundError),
+            (200, {"invalid": "data"}, OverseerrResponseError),
+        ],
+        ids=["success", "invalid_api_key", "not_found", "invalid_response"],
+    )
+    async def test_test_connection(
+        self, overseerr_client, mock_aiohttp, overseerr_urls, status, payload, expected
+    ):
+        """Test connection check succeeds or raises depending on the response"""
+        mock_aiohttp.get(
+            overseerr_urls["settings_main"],
+            status=status,
+            payload=payload,
+        )
 
-    @pytest.mark.asyncio
-    async def test_test_connection_invalid_response(self, overseerr_client):
-        """Test connection with unexpected response"""
-        with aioresponses() as m:
-            m.get(
-                f"{overseerr_client.base_url}settings/main",
-                status=200,
-                payload={"invalid": "data"},
-            )
-
-            with pytest.raises(Exception, match="Unexpected response"):
+        if expected is None:
+            assert await overseerr_client.test_connection() is True
+        else:
+            with pytest.raises(expected):
                 await overseerr_client.test_connection()
 
-    @pytest.mark.asyncio
-    async def test_search_media_success(self, overseerr_client, overseerr_search_response):
-        """Test successful media search"""
-        with aioresponses() as m:
-            m.get(
-                f"{overseerr_client.base_url}search?query=fight%20club&page=1&language=en",
-                status=200,
-                payload=overseerr_search_response,
-            )
-
-            results = await overseerr_client.search_media("fight club")
-
-            assert len(results) == 2
-            assert isinstance(results[0], TVShow)  # Higher popularity
-            assert results[0].tmdb_id == 1396
-            assert isinstance(results[1], Movie)
-            assert results[1].tmdb_id == 550
-
-    @pytest.mark.asyncio
-    async def test_search_media_empty_results(self, overseerr_client):
-        """Test media search with no results"""
-        with aioresponses() as m:
-            m.get(
-                f"{overseerr_client.base_url}search?query=nonexistent&page=1&language=en",
-                status=200,
-                payload={"page": 1, "totalPages": 1, "totalResults": 0, "results": []},
-            )
-
-            results = await overseerr_client.search_media("nonexistent")
-            assert len(results) == 0
-
-    @pytest.mark.asyncio
-    async def test_search_media_error(self, overseerr_client):
-        """Test media search with API error"""
-        with aioresponses() as m:
-            m.get(
-                f"{overseerr_client.base_url}search?query=error&page=1&language=en",
-                status=500,
-                payload={"message": "Internal server error"},
-            )
-
-            with pytest.raises(Exception, match="Search failed"):
-                await overseerr_client.search_media("error")
-
-    @pytest.mark.asyncio
-    async def test_search_media_special_characters(self, overseerr_client):
+    @pytest.mark.parametrize(
+        "mock_endpoint,expected",
+        [
+            # Results come back sorted by popularity, so the TV show leads
+            (
+                ("get", "search", 200, "overseerr_search_response_bytes"),
+                [(TVShow, 1396), (Movie, 550)],
+            ),
+            (("get", "search", 200, EMPTY_SEARCH), []),
+        ],
+        ids=["success", "empty_results"],
+        indirect=["mock_endpoint"],
+    )
+    async def test_search_media(self, overseerr_client, mock_endpoint, expected):
+        """Test media search converts and orders the results"""
+        results = await overseerr_client.search_media("fight club")
+
+        assert [(type(item), item.tmdb_id) for item in results] == expected
+
+    @pytest.mark.parametrize(
+        "mock_endpoint,call,error",
+        [
+            (
+                ("get", "search", 500, {"message": "Internal server error"}),
+                lambda client: client.search_media("error"),
+                OverseerrResponseError,
+            ),
+            (
+                ("get", "movie_999999", 404, {"message": "Movie not found"}),
+                lambda client: client.get_movie_by_id(999999),
+                OverseerrNotFoundError,
+            ),
+        ],
+        ids=["search_error", "movie_not_found"],
+        indirect=["mock_endpoint"],
+    )
+    async def test_lookup_errors(self, overseerr_client, mock_endpoint, call, error):
+        """Test lookups raise the matching error for failed responses"""
+        with pytest.raises(error):
+            await call(overseerr_client)
+
+    @pytest.mark.parametrize("mock_endpoint", [("get", "search", 200, EMPTY_SEARCH)], indirect=True)
+    async def test_search_media_special_characters(self, overseerr_client, mock_endpoint):
         """Test media search with special characters"""
-        with aioresponses() as m:
-            # URL encoding should handle special characters
-            m.get(
-                f"{overseerr_client.base_url}search?query=the%20%26%20fast&page=1&language=en",
-                status=200,
-                payload={"page": 1, "totalPages": 1, "totalResults": 0, "results": []},
-            )
-
-            results = await overseerr_client.search_media("the & fast")
-            assert isinstance(results, list)
-
-    @pytest.mark.asyncio
-    async def test_get_movie_by_id(self, overseerr_client, overseerr_movie_details_response):
+        # The search pattern rejects a bare "&" inside the query, so a match means the
+        # client percent-encoded it; decode the recorded URL rather than pinning the bytes
+        results = await overseerr_client.search_media("the & fast")
+        assert isinstance(results, list)
+
+        ((_, url),) = mock_endpoint.requests
+        assert url.query["query"] == "the & fast"
+
+    @pytest.mark.parametrize(
+        "mock_endpoint",
+        [("get", "movie_550", 200, "overseerr_movie_details_response_bytes")],
+        indirect=True,
+    )
+    async def test_get_movie_by_id(self, overseerr_client, mock_endpoint):
         """Test getting movie details by ID"""
-        with aioresponses() as m:
-            m.get(
-                f"{overseerr_client.base_url}movie/550",
-                status=200,
-                payload=overseerr_movie_details_response,
-            )
-
-            movie = await overseerr_client.get_movie_by_id(550)
-
-            assert isinstance(movie, Movie)
-            assert movie.tmdb_id == 550
-            assert movie.title == "Fight Club"
-            assert movie.available is True
-            assert len(movie.cast) == 3
-
-    @pytest.mark.asyncio
-    async def test_get_movie_by_id_4k(self, overseerr_client, overseerr_movie_details_response):
+        movie = await overseerr_client.get_movie_by_id(550)
+
+        assert isinstance(movie, Movie)
+        assert movie.tmdb_id == 550
+        assert movie.title == "Fight Club"
+        assert movie.available is True
+        assert len(movie.cast) == 3
+
+    async def test_get_movie_by_id_4k(
+        self, overseerr_client, mock_aiohttp, overseerr_urls, mutable_movie_details
+    ):
         """Test getting movie details with 4K status"""
         # Set 4K status to PENDING
-        overseerr_movie_details_response["mediaInfo"]["status4k"] = 2
-
-        with aioresponses() as m:
-            m.get(
-                f"{overseerr_client.base_url}movie/550",
-                status=200,
-                payload=overseerr_movie_details_response,
-            )
-
-            movie = await overseerr_client.get_movie_by_id(550, is_4k=True)
-
-            assert movie.requested is True
-            assert movie.status == MediaStatus.PENDING
-
-    @pytest.mark.asyncio
-    async def test_get_movie_by_id_not_found(self, overseerr_client):
-        """Test getting details for non-existent movie"""
-        with aioresponses() as m:
-            m.get(
-                f"{overseerr_client.base_url}movie/999999",
-                status=404,
-                payload={"message": "Movie not found"},
-            )
-
-            with pytest.raises(Exception, match="Movie not found"):
-                await overseerr_client.get_movie_by_id(999999)
-
-    @pytest.mark.asyncio
-    async def test_request_movie_success(
-        self, overseerr_client, overseerr_request_success_response
+        mutable_movie_details["mediaInfo"]["status4k"] = 2
+
+        mock_aiohttp.get(
+            overseerr_urls["movie_550"],
+            status=200,
+            payload=mutable_movie_details,
+        )
+
+        movie = await overseerr_client.get_movie_by_id(550, is_4k=True)
+
+        assert movie.requested is True
+        assert movie.status == MediaStatus.PENDING
+
+    @pytest.mark.parametrize(
+        "status,payload,is_4k,expect_success,error_fragment",
+        [
+            # payload None stands for overseerr_request_success_response
+            (201, None, False, True, ""),
+            (201, None, True, True, ""),
+            (403, {"message": "Request limit exceeded"}, False, False, "quota"),
+            # Any non-201 status is a failure
+            (400, {"message": "Already available"}, False, False, "already available"),
+        ],
+        ids=["success", "4k", "quota_exceeded", "already_available"],
+    )
+    async def test_request_movie(
+        self,
+        overseerr_client,
+        mock_aiohttp,
+        overseerr_urls,
+        overseerr_request_success_response,
+        status,
+        payload,
+        is_4k,
+        expect_success,
+        error_fragment,
     ):
-        """Test successful movie request"""
-        with aioresponses() as m:
-            m.post(
-                f"{overseerr_client.base_url}request",
-                status=201,
-                payload=overseerr_request_success_response,
-            )
-
-            result = await overseerr_client.request_movie(550)
-
-            assert isinstance(result, MovieRequestResult)
-            assert result.success is True
-            assert result.was_denied is False
-
-    @pytest.mark.asyncio
-    async def test_request_movie_quota_exceeded(self, overseerr_client):
-        """Test movie request with quota exceeded"""
-        with aioresponses() as m:
-            m.post(
-                f"{overseerr_client.base_url}request",
-                status=403,
-                payload={"message": "Request limit exceeded"},
-            )
-
-            result = await overseerr_client.request_movie(550)
-
-            assert result.success is False
-            assert result.was_denied is True
-            assert "quota" in result.error_message.lower()
-
-    @pytest.mark.asyncio
-    async def test_request_movie_4k(self, overseerr_client, overseerr_request_success_response):
-        """Test requesting a movie in 4K"""
-        overseerr_request_success_response["is4k"] = True
-
-        with aioresponses() as m:
-            m.post(
-                f"{overseerr_client.base_url}request",
-                status=201,
-                payload=overseerr_request_success_response,
-            )
-
-            result = await overseerr_client.request_movie(550, is_4k=True)
-            assert result.success is True
-
-    @pytest.mark.asyncio
-    async def test_request_movie_already_available(self, overseerr_client):
-        """Test requesting a movie that's already available"""
-        with aioresponses() as m:
-            m.post(
-                f"{overseerr_client.base_url}request",
-                status=400,  # Non-201 status
-                payload={"message": "Already available"},
-            )
-
-            result = await overseerr_client.request_movie(550)
-            # Should return failure since status is not 201
-            assert result.success is False
-
-    @pytest.mark.asyncio
+        """Test movie request results for each Overseerr response"""
+        if payload is None:
+            payload = {**overseerr_request_success_response, "is4k": is_4k}
+        url = overseerr_urls["request"]
+        mock_aiohttp.post(url, status=status, payload=payload)
+
+        result = await overseerr_client.request_movie(550, is_4k=is_4k)
+
+        assert isinstance(result, MovieRequestResult)
+        assert result.success is expect_success
+        assert result.was_denied is not expect_success
+        assert error_fragment in result.error_message.lower()
+
+        sent = mock_aiohttp.requests[("POST", URL(url))][0].kwargs["json"]
+        assert sent == {"mediaId": 550, "mediaType": "movie", "is4k": is_4k}
+
     async def test_close_session(self, overseerr_client):
         """Test closing the HTTP session"""
         # Create a session first
@@ -418,7 +345,6 @@ class TestOverseerrClient:
         await overseerr_client.close()
         assert session.closed
 
-    @pytest.mark.asyncio
     async def test_session_reuse(self, overseerr_client):
         """Test that the same session is reused"""
         session1 = await overseerr_client._get_session()
@@ -428,7 +354,6 @@ class TestOverseerrClient:
 
         await overseerr_client.close()
 
-    @pytest.mark.asyncio
     async def test_session_recreation_after_close(self, overseerr_client):
         """Test that a new session is created after closing"""
         session1 = await overseerr_client._get_session()
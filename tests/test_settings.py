@@ -3,6 +3,7 @@
 import json
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -53,6 +54,11 @@ class TestOverseerrSettings:
         settings = OverseerrSettings(hostname="overseerr.example.com", port=443, use_ssl=True)
         assert settings.base_url == "https://overseerr.example.com:443/api/v1/"
 
+    def test_invalid_port(self):
+        """Test port outside valid range is rejected"""
+        with pytest.raises(ValueError, match="Port must be between"):
+            OverseerrSettings(port=70000)
+
 
 @pytest.mark.unit
 class TestDiscordSettings:
@@ -129,65 +135,71 @@ class TestMovieCategorySettings:
 class TestBotSettings:
     """Test BotSettings model with environment variables"""
 
-    def test_default_values(self):
+    def test_default_values(self, default_settings):
         """Test default values without environment variables"""
-        settings = BotSettings()
-        assert settings.version == "1.0.0"
-        assert settings.log_level == "INFO"
-        assert isinstance(settings.discord, DiscordSettings)
-        assert isinstance(settings.overseerr, OverseerrSettings)
-        assert settings.movie_categories == []
-
-    def test_env_var_overrides(self, mock_env_vars):
-        """Test environment variable overrides"""
-        settings = BotSettings()
+        assert default_settings.version == "1.0.0"
+        assert default_settings.log_level == "INFO"
+        assert isinstance(default_settings.discord, DiscordSettings)
+        assert isinstance(default_settings.overseerr, OverseerrSettings)
+        assert default_settings.movie_categories == []
 
+    def test_env_var_overrides(self, env_settings):
+        """Test environment variable overrides"""
         # Check that env vars override defaults
-        assert settings.discord.bot_token == "test_bot_token_12345"
-        assert settings.discord.client_id == "123456789"
-        assert settings.overseerr.hostname == "test.overseerr.local"
-        assert settings.overseerr.port == 5055
-        assert settings.overseerr.api_key == "test_api_key_abcdef"
-        assert settings.overseerr.use_ssl is False
-
-    def test_authorized_users_parsing(self, monkeypatch):
-        """Test parsing comma-separated authorized users"""
-        monkeypatch.setenv("DISCORD_AUTHORIZED_USERS", "111,222,333")
-        settings = BotSettings()
-        assert settings.discord.authorized_users == [111, 222, 333]
-
-    def test_authorized_users_with_spaces(self, monkeypatch):
-        """Test parsing authorized users with spaces"""
-        monkeypatch.setenv("DISCORD_AUTHORIZED_USERS", "111, 222 , 333")
-        settings = BotSettings()
-        assert settings.discord.authorized_users == [111, 222, 333]
-
-    def test_empty_authorized_users(self, monkeypatch):
-        """Test empty authorized users string"""
-        monkeypatch.setenv("DISCORD_AUTHORIZED_USERS", "")
-        settings = BotSettings()
-        assert settings.discord.authorized_users == []
-
-    def test_notification_interval_override(self, monkeypatch):
-        """Test notification check interval override"""
-        monkeypatch.setenv("NOTIFICATION_CHECK_INTERVAL", "10")
-        settings = BotSettings()
-        assert settings.discord.notification_check_interval == 10
+        assert env_settings.discord.bot_token == "test_bot_token_12345"
+        assert env_settings.discord.client_id == "123456789"
+        assert env_settings.overseerr.hostname == "test.overseerr.local"
+        assert env_settings.overseerr.port == 5055
+        assert env_settings.overseerr.api_key == "test_api_key_abcdef"
+        assert env_settings.overseerr.use_ssl is False
+
+    @pytest.mark.parametrize(
+        "env_var, value, attr, expected",
+        [
+            ("DISCORD_AUTHORIZED_USERS", "111,222,333", "authorized_users", [111, 222, 333]),
+            ("DISCORD_AUTHORIZED_USERS", "111, 222 , 333", "authorized_users", [111, 222, 333]),
+            ("DISCORD_AUTHORIZED_USERS", "", "authorized_users", []),
+            ("NOTIFICATION_CHECK_INTERVAL", "10", "notification_check_interval", 10),
+        ],
+        ids=["authorized_users", "authorized_users_spaces", "authorized_users_empty", "interval"],
+    )
+    def test_discord_env_parsing(self, env, env_var, value, attr, expected):
+        """Test env var strings are parsed into Discord settings"""
+        with env(**{env_var: value}):
+            settings = BotSettings()
+        assert getattr(settings.discord, attr) == expected
+
+    def test_env_file_loading(self, tmp_path, monkeypatch, env):
+        """Test values are read from .env and os.environ takes precedence"""
+        (tmp_path / ".env").write_text(
+            "# comment\n"
+            "export DISCORD_BOT_TOKEN='file_token'\n"
+            "OVERSEERR_HOSTNAME=file.host  # inline comment\n"
+            "OVERSEERR_USE_SSL=true\n"
+        )
+        monkeypatch.chdir(tmp_path)
+
+        with env(OVERSEERR_HOSTNAME="env.host"):
+            settings = BotSettings()
+
+        assert settings.discord.bot_token == "file_token"
+        assert settings.overseerr.hostname == "env.host"
+        assert settings.overseerr.use_ssl is True
 
 
 @pytest.mark.unit
 class TestSettingsManager:
     """Test SettingsManager"""
 
-    def test_create_settings_manager(self, temp_settings_file):
+    def test_create_settings_manager(self, memory_settings_file):
         """Test creating a SettingsManager instance"""
-        manager = SettingsManager(config_path=str(temp_settings_file))
-        assert manager.config_path == temp_settings_file
+        manager = SettingsManager(config_path=str(memory_settings_file))
+        assert manager.config_path == memory_settings_file
         assert manager.settings is None
 
-    def test_load_from_file(self, temp_settings_file):
+    def test_load_from_file(self, memory_settings_file):
         """Test loading settings from file"""
-        manager = SettingsManager(config_path=str(temp_settings_file))
+        manager = SettingsManager(config_path=str(memory_settings_file))
         settings = manager.load()
 
         assert isinstance(settings, BotSettings)
@@ -199,21 +211,19 @@ class TestSettingsManager:
         # This is by design - only bot_token, client_id, and movie_categories
         # are loaded from file
 
-    def test_load_with_env_override(self, temp_settings_file, monkeypatch):
+    def test_load_with_env_override(self, memory_settings_file, env):
         """Test that environment variables override file settings"""
-        monkeypatch.setenv("DISCORD_BOT_TOKEN", "env_token")
-        monkeypatch.setenv("OVERSEERR_HOSTNAME", "env.host.com")
-
-        manager = SettingsManager(config_path=str(temp_settings_file))
-        settings = manager.load()
+        manager = SettingsManager(config_path=str(memory_settings_file))
+        with env(DISCORD_BOT_TOKEN="env_token", OVERSEERR_HOSTNAME="env.host.com"):
+            settings = manager.load()
 
         # Env vars should take precedence
         assert settings.discord.bot_token == "env_token"
         assert settings.overseerr.hostname == "env.host.com"
 
-    def test_save_settings(self, temp_config_dir):
+    def test_save_settings(self, memory_fs, memory_config_dir):
         """Test saving settings to file"""
-        settings_file = temp_config_dir / "new_settings.json"
+        settings_file = memory_config_dir / "new_settings.json"
         manager = SettingsManager(config_path=str(settings_file))
 
         # Load settings (will create file)
@@ -228,54 +238,95 @@ class TestSettingsManager:
         # Verify file was created and contains data
         assert settings_file.exists()
 
-        with open(settings_file, "r") as f:
-            data = json.load(f)
+        data = memory_fs.read_json(settings_file)
 
         assert data["discord"]["monitored_channels"] == [111, 222]
         assert data["discord"]["authorized_users"] == [333, 444]
 
-    def test_reload_settings(self, temp_settings_file):
+    def test_reload_settings(self, memory_fs, memory_settings_file):
         """Test reloading settings from file"""
-        manager = SettingsManager(config_path=str(temp_settings_file))
+        manager = SettingsManager(config_path=str(memory_settings_file))
 
         # Load initial settings
         settings1 = manager.load()
         assert len(settings1.movie_categories) == 1
 
         # Modify the file
-        with open(temp_settings_file, "r") as f:
-            data = json.load(f)
+        data = memory_fs.read_json(memory_settings_file)
         data["movie_categories"][0]["name"] = "4K"
-        with open(temp_settings_file, "w") as f:
-            json.dump(data, f)
+        memory_fs.write_json(memory_settings_file, data)
 
         # Reload settings
         settings2 = manager.reload()
         assert settings2.movie_categories[0].name == "4K"
 
-    def test_create_default_file(self, temp_config_dir):
+    def test_create_default_file(self, memory_config_dir):
         """Test creating default settings file when none exists"""
-        settings_file = temp_config_dir / "default_settings.json"
+        settings_file = memory_config_dir / "default_settings.json"
         manager = SettingsManager(config_path=str(settings_file))
 
-        # Load will create default file
-        settings = manager.load()
+        # Load writes the defaults exactly once; the write itself is mocked out
+        with patch.object(Path, "write_bytes", autospec=True) as mock_write:
+            settings = manager.load()
 
-        # File should now exist
-        assert settings_file.exists()
+        mock_write.assert_called_once()
+        (path, buf), _ = mock_write.call_args
+        assert path == settings_file
+        assert json.loads(buf)["version"] == settings.version
 
-    def test_sensitive_data_not_saved(self, temp_config_dir):
+    def test_sensitive_data_not_saved(self, memory_fs, memory_config_dir):
         """Test that sensitive data (tokens, API keys) are not saved to file"""
-        settings_file = temp_config_dir / "secure_settings.json"
+        settings_file = memory_config_dir / "secure_settings.json"
         manager = SettingsManager(config_path=str(settings_file))
 
         settings = manager.load()
         manager.settings = settings
         manager.save()
 
-        with open(settings_file, "r") as f:
-            data = json.load(f)
+        data = memory_fs.read_json(settings_file)
 
         # Bot token and API key should not be in the file
         assert "bot_token" not in data.get("discord", {})
         assert "api_key" not in data.get("overseerr", {})
+
+    def test_save_skips_unchanged_content(self, memory_fs, memory_config_dir):
+        """Test that saving identical settings does not rewrite the file"""
+        settings_file = memory_config_dir / "unchanged_settings.json"
+        manager = SettingsManager(config_path=str(settings_file))
+        manager.load()
+
+        with patch.object(
+            Path, "write_bytes", autospec=True, side_effect=Path.write_bytes
+        ) as mock_write:
+            manager.save()
+            assert not mock_write.called
+
+            manager.settings.discord.movie_roles = [123]
+            manager.save()
+            assert mock_write.call_count == 1
+
+        data = memory_fs.read_json(settings_file)
+        assert data["discord"]["movie_roles"] == [123]
+
+    def test_save_creates_config_directory(self, memory_config_dir):
+        """Test that the config directory is created on save, not on construction"""
+        settings_file = memory_config_dir / "nested" / "settings.json"
+        manager = SettingsManager(config_path=str(settings_file))
+        assert not settings_file.parent.exists()
+
+        manager.load()
+
+        assert settings_file.exists()
+
+    def test_save_recreates_removed_config_directory(self, tmp_path):
+        """Test saving still works after the config directory is removed"""
+        settings_file = tmp_path / "config" / "settings.json"
+        manager = SettingsManager(config_path=str(settings_file))
+        manager.load()
+
+        settings_file.unlink()
+        settings_file.parent.rmdir()
+        manager.settings.discord.movie_roles = [123]
+        manager.save()
+
+        assert settings_file.exists()